@@ -1,5 +1,5 @@
 """NBA Processor website generation."""
 
-from .generator import generate_website_from_data
+from .generator import encode_frame, generate_website_from_data
 
-__all__ = ['generate_website_from_data']
+__all__ = ['encode_frame', 'generate_website_from_data']
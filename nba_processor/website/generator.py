@@ -3,10 +3,22 @@ Website generator for interactive NBA stats HTML output with travel tracking.
 """
 
 import os
+import base64
+import csv
+import gzip
+import hashlib
+import io
 import json
+import math
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Set
+from html import escape
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 from ..utils.log import info
@@ -16,6 +28,81 @@ from ..utils.constants import (
     TEAM_CODE_TO_DIVISION, TEAM_CODE_ALIASES
 )
 
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import minify_html
+    HAS_MINIFY_HTML = True
+except ImportError:
+    HAS_MINIFY_HTML = False
+
+try:
+    import htmlmin
+    HAS_HTMLMIN = True
+except ImportError:
+    HAS_HTMLMIN = False
+
+try:
+    import rjsmin
+    HAS_RJSMIN = True
+except ImportError:
+    HAS_RJSMIN = False
+
+try:
+    import rcssmin
+    HAS_RCSSMIN = True
+except ImportError:
+    HAS_RCSSMIN = False
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Pre-compression settings (outputs are generated offline, so use max levels)
+_BROTLI_QUALITY = 11
+_GZIP_LEVEL = 9
+_COMPRESS_CHUNK_SIZE = 1 << 20
+
+# Page payload, written next to the HTML and fetched by app.js
+DATA_FILENAME = 'nba_data.json'
+
+# Placeholder for payload entries supplied pre-encoded via cached_json
+_CACHED = object()
+
+# Frames are encoded in parallel once the payload has this many rows; below
+# it the thread pool costs more than it saves
+_PARALLEL_ENCODE_ROWS = 50_000
+
+# Output files are written through a 1 MiB buffer (the default is 8 KiB)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Hashed asset names carry the first 10 hex digits of the content SHA-1
+_HASH_GLOB = '[0-9a-f]' * 10
+
+# Players table columns, in display order (playerCols in app.js)
+PLAYER_COLUMNS = [
+    'Player', 'Team', 'Games', 'MPG', 'PPG', 'RPG', 'APG', 'SPG', 'BPG', 'TOPG',
+    'FG%', '3P%', 'FT%', 'TS%', 'eFG%', 'Total PTS', 'Total REB', 'Total AST', 'Total +/-',
+]
+
+# Low-cardinality player_games columns, shipped as categories + codes
+_CATEGORY_COLUMNS = ('team', 'opponent', 'result', 'game_type')
+
+# Shared default for missing processed_data tables; read-only
+_EMPTY_DF = pd.DataFrame()
+
 
 def _get_project_root() -> Path:
     """Get the project root directory."""
@@ -85,6 +172,7 @@ def _find_witnessed_career_firsts(games_df: pd.DataFrame, career_firsts_cache: d
                     'player_id': player_id,
                     'player_name': player_name,
                     'milestone': first_info.get('milestone', ''),
+                    'milestone_number': 0,
                     'stat': stat,
                     'date': first_info.get('date', ''),
                     'game_id': game_id,
@@ -112,15 +200,70 @@ def _find_witnessed_career_firsts(games_df: pd.DataFrame, career_firsts_cache: d
                         'career_total_after': milestone_info.get('career_total_after', 0),
                     })
 
-    # Sort by date (most recent first), then by milestone importance
-    def sort_key(x):
-        date = x.get('date', '')
-        milestone_num = x.get('milestone_number', 0)
-        return (date, milestone_num)
-
-    witnessed.sort(key=sort_key, reverse=True)
+    # Sort by date (most recent first), then by milestone importance; every
+    # entry carries both keys, so the key can be a C-level itemgetter
+    witnessed.sort(key=itemgetter('date', 'milestone_number'), reverse=True)
     return witnessed
 
+# Milestone categories for filtering
+MILESTONE_CATEGORIES: Dict[str, List[str]] = {
+    'multi': ['quadruple_doubles', 'triple_doubles', 'double_doubles', 'near_triple_doubles',
+              'near_double_doubles', 'five_by_fives', 'all_around_games'],
+    'scoring': ['seventy_point_games', 'sixty_point_games', 'fifty_point_games',
+                'forty_five_point_games', 'forty_point_games', 'thirty_five_point_games',
+                'thirty_point_games', 'twenty_five_point_games', 'twenty_point_games'],
+    'rebounding': ['twenty_five_rebound_games', 'twenty_rebound_games', 'eighteen_rebound_games',
+                   'fifteen_rebound_games', 'twelve_rebound_games', 'ten_rebound_games'],
+    'assists': ['twenty_assist_games', 'fifteen_assist_games', 'twelve_assist_games', 'ten_assist_games'],
+    'steals': ['ten_steal_games', 'seven_steal_games', 'five_steal_games', 'four_steal_games'],
+    'blocks': ['ten_block_games', 'seven_block_games', 'five_block_games', 'four_block_games'],
+    'threes': ['ten_three_games', 'eight_three_games', 'seven_three_games',
+               'six_three_games', 'five_three_games', 'perfect_from_three'],
+    'efficiency': ['hot_shooting_games', 'perfect_ft_games', 'perfect_fg_games',
+                   'efficient_scoring_games', 'high_game_score'],
+    'combined': ['thirty_ten_games', 'twenty_five_ten_games', 'twenty_ten_games',
+                 'twenty_ten_five_games', 'twenty_twenty_games', 'points_assists_double_double'],
+    'defensive': ['defensive_monster_games', 'zero_turnover_games'],
+    'plusminus': ['plus_25_games', 'plus_20_games', 'minus_25_games']
+}
+
+# Master order for the "all" milestones view (related stats grouped together)
+MILESTONE_ORDER: List[str] = [
+    # Multi-stat achievements
+    'quadruple_doubles', 'triple_doubles', 'near_triple_doubles', 'double_doubles', 'near_double_doubles',
+    'five_by_fives', 'all_around_games',
+    # Scoring (high to low)
+    'seventy_point_games', 'sixty_point_games', 'fifty_point_games', 'forty_five_point_games',
+    'forty_point_games', 'thirty_five_point_games', 'thirty_point_games', 'twenty_five_point_games', 'twenty_point_games',
+    # Combined stats
+    'twenty_twenty_games', 'thirty_ten_games', 'twenty_five_ten_games', 'twenty_ten_five_games',
+    'twenty_ten_games', 'points_assists_double_double',
+    # Rebounding (high to low)
+    'twenty_five_rebound_games', 'twenty_rebound_games', 'eighteen_rebound_games',
+    'fifteen_rebound_games', 'twelve_rebound_games', 'ten_rebound_games',
+    # Assists (high to low)
+    'twenty_assist_games', 'fifteen_assist_games', 'twelve_assist_games', 'ten_assist_games',
+    # Three-pointers
+    'ten_three_games', 'eight_three_games', 'seven_three_games', 'six_three_games', 'five_three_games', 'perfect_from_three',
+    # Steals (high to low)
+    'ten_steal_games', 'seven_steal_games', 'five_steal_games', 'four_steal_games',
+    # Blocks (high to low)
+    'ten_block_games', 'seven_block_games', 'five_block_games', 'four_block_games',
+    # Efficiency
+    'high_game_score', 'efficient_scoring_games', 'hot_shooting_games', 'perfect_fg_games', 'perfect_ft_games',
+    # Defensive
+    'defensive_monster_games', 'zero_turnover_games',
+    # Plus/Minus
+    'plus_25_games', 'plus_20_games', 'minus_25_games'
+]
+
+# Arena reference table, built once; venue stats are merged onto it
+_ARENAS_DF = (
+    pd.DataFrame.from_dict(NBA_ARENAS, orient='index')[['name', 'team', 'city', 'state', 'lat', 'lng']]
+    .rename_axis('code')
+    .reset_index()
+)
+
 # Path to static assets
 STATIC_DIR = Path(__file__).parent / 'static'
 
@@ -133,16 +276,26 @@ def _load_static_file(filename: str) -> str:
     return ''
 
 
-def _get_css() -> str:
-    """Load CSS from external file."""
-    return _load_static_file('styles.css')
+def _minify_css(css: str) -> str:
+    """Minify a stylesheet with rcssmin when it is installed."""
+    return rcssmin.cssmin(css) if HAS_RCSSMIN else css
+
 
+def _minify_js(js: str) -> str:
+    """Minify a script with rjsmin when it is installed."""
+    return rjsmin.jsmin(js) if HAS_RJSMIN else js
 
-def _get_javascript() -> str:
-    """Load JavaScript from external file, prepending dynamic constants."""
-    js_content = _load_static_file('app.js')
-    # The app.js already includes everything, just return it
-    return js_content
+
+def _minify_html(html: str) -> str:
+    """Minify page markup with minify-html, falling back to htmlmin, else unchanged."""
+    if HAS_MINIFY_HTML:
+        return minify_html.minify(
+            html, minify_js=True, minify_css=True,
+            keep_closing_tags=True, keep_html_and_head_opening_tags=True,
+        )
+    if HAS_HTMLMIN:
+        return htmlmin.minify(html, remove_comments=True, remove_empty_space=True)
+    return html
 
 
 def _generate_js_constants() -> str:
@@ -163,34 +316,10 @@ def _generate_js_constants() -> str:
         else:
             team_short_names[name] = parts[-1]
 
-    # Milestone categories for filtering
-    milestone_categories = {
-        'multi': ['quadruple_doubles', 'triple_doubles', 'double_doubles', 'near_triple_doubles',
-                  'near_double_doubles', 'five_by_fives', 'all_around_games'],
-        'scoring': ['seventy_point_games', 'sixty_point_games', 'fifty_point_games',
-                    'forty_five_point_games', 'forty_point_games', 'thirty_five_point_games',
-                    'thirty_point_games', 'twenty_five_point_games', 'twenty_point_games'],
-        'rebounding': ['twenty_five_rebound_games', 'twenty_rebound_games', 'eighteen_rebound_games',
-                       'fifteen_rebound_games', 'twelve_rebound_games', 'ten_rebound_games'],
-        'assists': ['twenty_assist_games', 'fifteen_assist_games', 'twelve_assist_games', 'ten_assist_games'],
-        'steals': ['ten_steal_games', 'seven_steal_games', 'five_steal_games', 'four_steal_games'],
-        'blocks': ['ten_block_games', 'seven_block_games', 'five_block_games', 'four_block_games'],
-        'threes': ['ten_three_games', 'eight_three_games', 'seven_three_games',
-                   'six_three_games', 'five_three_games', 'perfect_from_three'],
-        'efficiency': ['hot_shooting_games', 'perfect_ft_games', 'perfect_fg_games',
-                       'efficient_scoring_games', 'high_game_score'],
-        'combined': ['thirty_ten_games', 'twenty_five_ten_games', 'twenty_ten_games',
-                     'twenty_ten_five_games', 'twenty_twenty_games', 'points_assists_double_double'],
-        'defensive': ['defensive_monster_games', 'zero_turnover_games'],
-        'plusminus': ['plus_25_games', 'plus_20_games', 'minus_25_games']
-    }
-
-    import json
     return f'''
 // Auto-generated constants from Python
 const TEAM_SHORT_NAMES = {json.dumps(team_short_names)};
 const TEAM_CODES = {json.dumps(team_codes_js)};
-const MILESTONE_CATEGORIES = {json.dumps(milestone_categories)};
 
 function getShortName(fullName) {{
     return TEAM_SHORT_NAMES[fullName] || fullName;
@@ -205,6 +334,12 @@ function getTeamCode(fullName) {{
 '''
 
 
+# Page CSS and JavaScript, loaded, minified and encoded once at import. The
+# team constants are generated from NBA_TEAMS and joined in front of app.js
+_CSS = _minify_css(_load_static_file('styles.css')).encode('utf-8')
+_JS = _minify_js(''.join([_generate_js_constants(), _load_static_file('app.js')])).encode('utf-8')
+
+
 def _serialize_espn_pbp_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
     """Serialize ESPN PBP analysis dict with camelCase keys for JavaScript."""
     if not analysis:
@@ -224,33 +359,321 @@ def _serialize_espn_pbp_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
     return _convert(analysis)
 
 
-def generate_website_from_data(processed_data: Dict[str, pd.DataFrame], output_path: str, games_data: List[Dict] = None) -> None:
+def _dumps_json(obj: Any) -> bytes:
+    """
+    Serialize the page payload compactly to UTF-8 bytes, using orjson when it
+    is installed (its native output is bytes, so there is no decode/encode).
+
+    Datetimes are passed through to ``default=str`` so both encoders format
+    them the same way ("2024-01-02 03:04:00"). The output is strict JSON
+    (NaN becomes null) since the page reads it with JSON.parse.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj, default=str,
+            option=(orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_PASSTHROUGH_DATETIME),
+        )
+    return json.dumps(
+        _nan_to_none(obj), default=str, separators=(',', ':'), ensure_ascii=False, allow_nan=False,
+    ).encode('utf-8')
+
+
+def _nan_to_none(obj: Any) -> Any:
+    """Replace NaN/inf floats with None so the stdlib encoder emits strict JSON."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _nan_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return _nan_to_none(obj.tolist())
+    return obj
+
+
+def _frame_payload(key: str, df: pd.DataFrame) -> Any:
+    """Convert one processed DataFrame to the shape the page expects."""
+    if key == 'player_games':
+        return _player_games_table(*_prepare_player_games(df))
+    # The players table ships as one array per player, indexed by column
+    return _player_rows(df) if key == 'players' else _df_to_records(df)
+
+
+def encode_frame(key: str, df: pd.DataFrame) -> bytes:
+    """
+    Serialize one processed DataFrame exactly as generate_website_from_data
+    would, for passing back in through its `cached_json` argument.
+    """
+    return _dumps_json(_frame_payload(key, df))
+
+
+def _encode_frames(frames: Dict[str, pd.DataFrame]) -> Dict[str, bytes]:
+    """Run encode_frame over each frame, on a thread pool for large payloads."""
+    if len(frames) < 2 or sum(len(df) for df in frames.values()) < _PARALLEL_ENCODE_ROWS:
+        return {key: encode_frame(key, df) for key, df in frames.items()}
+    with ThreadPoolExecutor(max_workers=min(len(frames), os.cpu_count() or 1)) as pool:
+        futures = {key: pool.submit(encode_frame, key, df) for key, df in frames.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def _dumps_payload(data: Dict[str, Any], cached_json: Dict[str, bytes]) -> bytes:
+    """
+    Serialize the page payload, splicing in pre-encoded values for entries
+    marked _CACHED rather than decoding and re-encoding them.
+    """
+    if not cached_json:
+        return _dumps_json(data)
+    parts = []
+    for key, value in data.items():
+        encoded = cached_json[key] if value is _CACHED else _dumps_json(value)
+        parts.append(_dumps_json(key) + b':' + encoded)
+    return b'{' + b','.join(parts) + b'}'
+
+
+def _df_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a DataFrame to a list of row dicts.
+
+    Goes through Arrow when pyarrow is installed, which builds the rows in C
+    instead of boxing every cell through pandas. Missing values come out as
+    None either way once serialized.
+    """
+    if HAS_PYARROW:
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+        except (pa.ArrowException, ValueError):
+            # Mixed-type object columns etc.; let pandas handle them
+            pass
+    return df.to_dict(orient='records')
+
+
+def _df_to_table(df: pd.DataFrame, categorical: Tuple[str, ...] = (),
+                 factorized: Optional[Dict[str, Tuple[np.ndarray, pd.Index]]] = None) -> Dict[str, Any]:
+    """
+    Convert a DataFrame to ``{'columns': [...], 'data': [column, ...]}``.
+
+    Columns named in `categorical` are stored as
+    ``{'categories': [...], 'codes': [...]}`` so each distinct string is
+    written once; a code of -1 marks a missing value. `factorized` supplies
+    already computed (codes, categories) for columns stored the same way.
+    Integer columns are packed with _pack_int_column.
+    """
+    factorized = factorized or {}
+    data: List[Any] = []
+    for col in df.columns:
+        if col in factorized:
+            codes, categories = factorized[col]
+            data.append({'categories': categories.tolist(), 'codes': codes.tolist()})
+        elif col in categorical:
+            values = df[col].astype('category').cat
+            data.append({'categories': values.categories.tolist(), 'codes': values.codes.tolist()})
+        elif isinstance(df[col].dtype, np.dtype) and df[col].dtype.kind in 'biuf':
+            # orjson encodes numeric arrays straight from the buffer,
+            # without boxing each cell into a Python number first
+            values = df[col].to_numpy()
+            packed = _pack_int_column(values) if values.dtype.kind in 'iu' else None
+            data.append(packed or values)
+        else:
+            data.append(df[col].tolist())
+    return {'columns': [str(c) for c in df.columns], 'data': data}
+
+
+# Payload dtype tag -> little-endian numpy dtype, narrowest first
+_INT_PACKINGS = (('i1', '<i1'), ('i2', '<i2'), ('i4', '<i4'))
+
+
+def _pack_int_column(values: np.ndarray) -> Optional[Dict[str, str]]:
+    """
+    Pack an integer column as ``{'dtype': 'i2', 'b64': ...}`` in the narrowest
+    signed type that holds it, which the page reads as a typed array instead
+    of parsing each number. Returns None if it needs more than 32 bits.
+    """
+    lo, hi = (int(values.min()), int(values.max())) if len(values) else (0, 0)
+    for tag, dtype in _INT_PACKINGS:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return {'dtype': tag, 'b64': _b64_array(values, dtype)}
+    return None
+
+
+def _df_to_rows(df: pd.DataFrame, columns: List[str]) -> Dict[str, Any]:
+    """
+    Convert a DataFrame to ``{'columns': columns, 'rows': [[values], ...]}``.
+
+    Rows follow the given column order; columns the frame lacks are filled
+    with missing values (null once serialized) and any others are dropped.
+    """
+    df = df.reindex(columns=columns)
+    values = [df[c].tolist() for c in columns]
+    return {'columns': columns, 'rows': [list(row) for row in zip(*values)]}
+
+
+def _player_rows(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Build the players table (see _df_to_rows), appending each row's CSV line
+    as one extra value so the page's CSV download is a plain join.
+    """
+    table = _df_to_rows(df, PLAYER_COLUMNS)
+    # Quoting is decided here, once per build (QUOTE_MINIMAL: only cells with
+    # ',' or '"'), so the download never inspects cell values
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator='')
+    for row in table['rows']:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerow([_csv_value(v) for v in row])
+        row.append(buf.getvalue())
+    return table
+
+
+def _csv_value(value: Any) -> Any:
+    """Write a CSV cell the way JavaScript prints it (10.0 as 10, missing as blank)."""
+    if value is None or (isinstance(value, float) and not math.isfinite(value)):
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _b64_array(values: Any, dtype: str) -> str:
+    """Pack numbers as `dtype` (little-endian, e.g. '<f4') bytes, base64-encoded, for a typed array on the page."""
+    return base64.b64encode(np.asarray(values, dtype=dtype).tobytes()).decode('ascii')
+
+
+def _search_key(*values: Any) -> str:
+    """
+    Build a lowercase search key so the page filters without re-lowercasing
+    every row per keystroke. Fields are joined with a newline, which a text
+    input cannot contain, so a query never matches across two fields.
+    """
+    return '\n'.join(str(v) for v in values if v).lower()
+
+
+def _venue_popup(venue: Dict[str, Any]) -> str:
+    """Build a venue's map popup markup once here instead of per marker on the page."""
+    status = f"{venue['games']} games" if venue['visited'] else 'Not visited'
+    return (f"<strong>{venue['team']}</strong><br>{venue['name']}<br>"
+            f"{venue['city']}, {venue['state']}<br><em>{status}</em>")
+
+
+def _index_milestones(milestones: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy milestone lists sorted by date (newest first) with search keys added."""
+    indexed = {}
+    for key, rows in milestones.items():
+        if not isinstance(rows, list):
+            indexed[key] = rows
+            continue
+        rows = sorted(rows, key=lambda m: m.get('date_yyyymmdd') or '', reverse=True)
+        indexed[key] = [{**m, '_k': _search_key(m.get('player'), m.get('team'))} for m in rows]
+    return indexed
+
+
+def _bucket_milestones(milestones: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Map each filter category (plus 'all') to its non-empty milestone keys in display order."""
+    present = [k for k, v in milestones.items() if isinstance(v, list) and v]
+    present_set = set(present)
+    ordered = [k for k in MILESTONE_ORDER if k in present_set]
+    ordered_set = set(ordered)
+    buckets = {'all': ordered + [k for k in present if k not in ordered_set]}
+    for category, keys in MILESTONE_CATEGORIES.items():
+        buckets[category] = [k for k in keys if k in present_set]
+    return buckets
+
+
+# Rows shown per milestone card; filterMilestones in app.js uses the same cap
+MILESTONE_ROWS_SHOWN = 50
+
+
+def _milestones_html(milestones: Dict[str, Any], keys: List[str], descriptions: Dict[str, str]) -> str:
+    """
+    Render the milestone cards for `keys` (the unfiltered view) with the same
+    markup filterMilestones builds, so the page can show it without a pass
+    over the rows.
+    """
+    parts = []
+    for key in keys:
+        rows = milestones.get(key) or []
+        title = descriptions.get(key) or re.sub(r'\b\w', lambda m: m.group().upper(), key.replace('_', ' '))
+        parts.append(f'<div class="milestone-card"><h4>{escape(title)} <span class="count">{len(rows)}</span></h4>')
+        if not rows:
+            parts.append('<p class="empty">None recorded</p>')
+        else:
+            parts.append('<div class="table-container" style="max-height:300px;"><table><thead><tr><th>Date</th>'
+                         '<th>Player</th><th>Team</th><th>vs</th><th>Detail</th></tr></thead><tbody>')
+            for m in rows[:MILESTONE_ROWS_SHOWN]:
+                player = escape(str(m.get('player') or ''))
+                date, team, opponent, detail = (
+                    escape(str(m.get(col) or '')) for col in ('date', 'team', 'opponent', 'detail'))
+                parts.append(f'<tr><td>{date}</td><td><span class="player-link" data-player="{player}">{player}</span>'
+                             f'</td><td>{team}</td><td>{opponent}</td><td>{detail}</td></tr>')
+            if len(rows) > MILESTONE_ROWS_SHOWN:
+                parts.append('<tr><td colspan="5" style="text-align:center;color:var(--text-muted);">'
+                             f'...and {len(rows) - MILESTONE_ROWS_SHOWN} more</td></tr>')
+            parts.append('</tbody></table></div>')
+        parts.append('</div>')
+    return ''.join(parts)
+
+
+def generate_website_from_data(processed_data: Dict[str, pd.DataFrame], output_path: str, games_data: List[Dict] = None,
+                               cached_json: Optional[Dict[str, bytes]] = None) -> None:
     """
     Generate interactive HTML website from processed data.
+
+    Args:
+        processed_data: Output of PlayerStatsProcessor.process_all_player_stats()
+        output_path: Path of the HTML page; assets are written next to it
+        games_data: Original game dicts, used for accurate home/away info
+        cached_json: Already-serialized DataFrame entries, keyed like
+            processed_data (see encode_frame). These are spliced into the
+            payload as-is instead of being converted again.
     """
     info(f"Generating website: {output_path}")
-
-    # Serialize DataFrames to JSON
-    data = {}
-    for key, df in processed_data.items():
-        if isinstance(df, pd.DataFrame) and not df.empty:
-            if key == 'player_games' and 'date' in df.columns:
-                df = df.sort_values('date', ascending=False)
-            data[key] = df.to_dict(orient='records')
+    cached_json = cached_json or {}
+
+    # Serialize DataFrames to JSON; each is encoded on its own and spliced
+    # into the payload alongside any pre-encoded ones
+    frames = {key: df for key, df in processed_data.items() if isinstance(df, pd.DataFrame) and not df.empty}
+    data: Dict[str, Any] = dict.fromkeys(frames, _CACHED)
+
+    # player_games and the one-row-per-game summary come out of one pass
+    games_df = processed_data.get('player_games', _EMPTY_DF)
+    encode_games = 'player_games' in frames and 'player_games' not in cached_json
+    games_table, games_summary = _process_player_games(games_df, games_data, include_table=encode_games)
+    cached_json = {**cached_json, **_encode_frames({
+        k: df for k, df in frames.items() if k not in cached_json and k != 'player_games'
+    })}
+    if games_table is not None:
+        cached_json['player_games'] = _dumps_json(games_table)
 
     # Include milestones and descriptions (already dicts, not DataFrames)
     if 'milestones' in processed_data and isinstance(processed_data['milestones'], dict):
-        data['milestones'] = processed_data['milestones']
+        data['milestones'] = _index_milestones(processed_data['milestones'])
+        data['milestonesByCategory'] = _bucket_milestones(data['milestones'])
     if 'milestone_descriptions' in processed_data and isinstance(processed_data['milestone_descriptions'], dict):
         data['milestone_descriptions'] = processed_data['milestone_descriptions']
+    if 'milestones' in data:
+        # Default view (all categories, no search), prerendered
+        data['milestonesHtml'] = _milestones_html(
+            data['milestones'], data['milestonesByCategory']['all'], data.get('milestone_descriptions', {}))
 
-    # Build games summary (one row per game, not per player)
-    games_df = processed_data.get('player_games', pd.DataFrame())
-    data['games'] = _build_games_summary(games_df, all_games=games_data)
+    # One row per game, not per player
+    data['games'] = games_summary
 
     # Calculate venue/travel stats
     venue_stats = _calculate_venue_stats(games_df)
-    data['venues'] = venue_stats['venues']
+    venues = venue_stats['venues']
+    # Marker coordinates travel as typed-array columns rather than per venue
+    data['venue_lat'] = _b64_array([v['lat'] for v in venues], '<f4')
+    data['venue_lng'] = _b64_array([v['lng'] for v in venues], '<f4')
+    data['venues'] = [
+        {**{k: x for k, x in v.items() if k not in ('lat', 'lng')},
+         '_k': _search_key(v['name'], v['team'], v['city']), '_popup': _venue_popup(v)}
+        for v in venues
+    ]
+    # Positions into data['venues'] for the visited/unvisited filter views
+    data['venues_visited'] = [i for i, v in enumerate(data['venues']) if v['visited']]
+    data['venues_unvisited'] = [i for i, v in enumerate(data['venues']) if not v['visited']]
 
     # Calculate team checklist (teams/divisions/conferences seen)
     team_checklist = _calculate_team_checklist(games_df)
@@ -259,12 +682,12 @@ def generate_website_from_data(processed_data: Dict[str, pd.DataFrame], output_p
     # Load career firsts and find witnessed ones
     career_firsts_cache = _load_career_firsts_cache()
     witnessed_firsts = _find_witnessed_career_firsts(games_df, career_firsts_cache)
-    data['careerFirsts'] = witnessed_firsts
+    data['careerFirsts'] = [{**f, '_k': _search_key(f.get('player_name'), f.get('milestone'))} for f in witnessed_firsts]
     if witnessed_firsts:
         info(f"  Found {len(witnessed_firsts)} witnessed career firsts/milestones")
 
     # Calculate summary stats
-    players_df = processed_data.get('players', pd.DataFrame())
+    players_df = processed_data.get('players', _EMPTY_DF)
 
     # Count milestones from the milestones dict
     milestones = data.get('milestones', {})
@@ -287,28 +710,126 @@ def generate_website_from_data(processed_data: Dict[str, pd.DataFrame], output_p
     }
     data['summary'] = summary
 
-    json_data = json.dumps(data, default=str)
+    json_data = _dumps_payload(data, cached_json)
 
     output_dir = os.path.dirname(output_path)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
 
-    html = _generate_html(json_data, summary)
+    css_href = _write_hashed_asset(output_dir, 'styles', 'css', _CSS)
+    js_href = _write_hashed_asset(output_dir, 'app', 'js', _JS)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # The payload keeps a fixed name; the version query makes browsers refetch
+    # it only when it changes
+    data_path = os.path.join(output_dir, DATA_FILENAME)
+    data_href = f"{DATA_FILENAME}?v={hashlib.sha1(json_data).hexdigest()[:10]}"
+    html = _generate_html(summary, css_href, js_href, data_href)
+
+    Path(data_path).write_bytes(json_data)
+    Path(output_path).write_bytes(html)
+    _write_precompressed(data_path)
+    _write_precompressed(output_path)
 
     info(f"Website saved: {output_path}")
 
 
-def _build_games_summary(games_df: pd.DataFrame, all_games: List[Dict] = None) -> List[Dict]:
+def _write_hashed_asset(output_dir: str, stem: str, ext: str, payload: bytes) -> str:
+    """
+    Write a static asset as `<stem>.<hash>.<ext>` next to the page and return
+    its file name for use as a relative URL.
+
+    The name changes only when the content does, so browsers can cache it
+    indefinitely. Older hashed copies of the same asset are removed.
+    """
+    filename = f"{stem}.{hashlib.sha1(payload).hexdigest()[:10]}.{ext}"
+    asset_dir = Path(output_dir or '.')
+    asset_path = asset_dir / filename
+
+    for stale in asset_dir.glob(f"{stem}.{_HASH_GLOB}.{ext}"):
+        if stale.name != filename:
+            for suffix in ('', '.gz', '.br'):
+                Path(str(stale) + suffix).unlink(missing_ok=True)
+
+    if not asset_path.exists() or asset_path.read_bytes() != payload:
+        asset_path.write_bytes(payload)
+        _write_precompressed(str(asset_path))
+
+    return filename
+
+
+def _write_precompressed(path: str) -> None:
+    """
+    Write pre-compressed siblings of a generated file so static hosts can
+    serve them with Content-Encoding instead of compressing per request.
+
+    Always writes `<path>.gz`; also writes `<path>.br` when brotli is installed,
+    otherwise removes any `<path>.br` left by an earlier build so hosts never
+    serve a stale copy.
+    """
+    with open(path, 'rb') as src, open(path + '.gz', 'wb', buffering=_WRITE_BUFFER_SIZE) as dst:
+        # mtime=0 keeps the output byte-identical across rebuilds
+        with gzip.GzipFile(filename='', mode='wb', fileobj=dst,
+                           compresslevel=_GZIP_LEVEL, mtime=0) as gz:
+            shutil.copyfileobj(src, gz, _COMPRESS_CHUNK_SIZE)
+
+    if HAS_BROTLI:
+        compressor = brotli.Compressor(quality=_BROTLI_QUALITY)
+        with open(path, 'rb') as src, open(path + '.br', 'wb', buffering=_WRITE_BUFFER_SIZE) as dst:
+            for chunk in iter(lambda: src.read(_COMPRESS_CHUNK_SIZE), b''):
+                dst.write(compressor.process(chunk))
+            dst.write(compressor.finish())
+    else:
+        Path(path + '.br').unlink(missing_ok=True)
+
+
+def _prepare_player_games(games_df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray, pd.Index]:
+    """
+    Sort player_games newest first and factorize its game IDs.
+
+    The sort is stable, so rows sharing a date (every row of one game) keep
+    their processed order. Returns the sorted frame, each row's game code
+    (-1 for a missing ID) and the game IDs in order of first appearance.
+    """
+    if 'date' in games_df.columns:
+        games_df = games_df.sort_values('date', ascending=False, kind='stable')
+    if 'game_id' not in games_df.columns:
+        return games_df, np.full(len(games_df), -1, dtype=np.intp), pd.Index([])
+    codes, game_ids = pd.factorize(games_df['game_id'])
+    return games_df, codes, game_ids
+
+
+def _player_games_table(games_df: pd.DataFrame, codes: np.ndarray, game_ids: pd.Index) -> Dict[str, Any]:
+    """Build the player_games payload table from _prepare_player_games output."""
+    return _df_to_table(games_df, _CATEGORY_COLUMNS, factorized={'game_id': (codes, game_ids)})
+
+
+def _process_player_games(games_df: pd.DataFrame, all_games: List[Dict] = None,
+                          include_table: bool = True) -> Tuple[Optional[Dict[str, Any]], List[Dict]]:
+    """
+    Build the player_games payload table and the one-row-per-game summary
+    from a single sort and game ID factorization.
+
+    Args:
+        games_df: The player_games frame
+        all_games: Original game dicts, used for accurate home/away info
+        include_table: False when only the summary is needed (the table is
+            then returned as None)
+
+    Returns:
+        (player_games table, games summary)
+    """
+    games_df, codes, game_ids = _prepare_player_games(games_df)
+    table = _player_games_table(games_df, codes, game_ids) if include_table else None
+    return table, _summarize_games(games_df, codes, game_ids, all_games)
+
+
+def _summarize_games(games_df: pd.DataFrame, codes: np.ndarray, game_ids: pd.Index,
+                     all_games: List[Dict] = None) -> List[Dict]:
     """Build one row per game with aggregated info."""
-    if games_df.empty:
+    if not len(game_ids):
         return []
 
     games = []
-    if 'game_id' not in games_df.columns:
-        return []
 
     # Build a lookup from game_id to original game data for accurate home/away info
     game_lookup = {}
@@ -318,9 +839,36 @@ def _build_games_summary(games_df: pd.DataFrame, all_games: List[Dict] = None) -
             if gid:
                 game_lookup[gid] = g
 
-    for game_id, group in games_df.groupby('game_id'):
-        first = group.iloc[0]
-
+    # First row and player count per game, straight from the factorized IDs
+    # (codes number games in order of first appearance); ordered newest
+    # first, stable on ties
+    rows = np.flatnonzero(codes >= 0)
+    first_rows = rows[np.unique(codes[rows], return_index=True)[1]]
+    firsts = games_df.iloc[first_rows]
+    summary = pd.DataFrame({
+        'game_id': game_ids.to_numpy(),
+        'date': firsts['date'].to_numpy() if 'date' in firsts.columns else '',
+        'date_yyyymmdd': firsts['date_yyyymmdd'].to_numpy() if 'date_yyyymmdd' in firsts.columns else '',
+        'game_type': firsts['game_type'].to_numpy() if 'game_type' in firsts.columns else 'regular',
+        'players': np.bincount(codes[rows], minlength=len(game_ids)),
+    })
+    summary = summary.sort_values('game_id', kind='stable')
+    summary = summary.sort_values('date_yyyymmdd', ascending=False, kind='stable')
+
+    # Games without original box score info fall back to the player rows:
+    # collect each team's first row (appearance order) for just those games
+    fallback_ids = [gid for gid in summary['game_id'] if not game_lookup.get(gid, {}).get('basic_info')]
+    team_rows: Dict[str, List[tuple]] = {}
+    if fallback_ids:
+        fallback_df = games_df[games_df['game_id'].isin(fallback_ids)].drop_duplicates(['game_id', 'team'])
+        scores = fallback_df['score'] if 'score' in fallback_df.columns else [''] * len(fallback_df)
+        for gid, team, score in zip(fallback_df['game_id'], fallback_df['team'], scores):
+            team_rows.setdefault(gid, []).append((team, score))
+
+    for game_id, date, date_yyyymmdd, game_type, players in zip(
+        summary['game_id'].tolist(), summary['date'].tolist(), summary['date_yyyymmdd'].tolist(),
+        summary['game_type'].tolist(), summary['players'].tolist(),
+    ):
         # Try to get accurate home/away from original game data
         original = game_lookup.get(game_id, {})
         basic_info = original.get('basic_info', {})
@@ -331,53 +879,18 @@ def _build_games_summary(games_df: pd.DataFrame, all_games: List[Dict] = None) -
             away_score = basic_info.get('away_score', 0)
             home_score = basic_info.get('home_score', 0)
         else:
-            # Fallback to player data - determine home team from game_id
-            # game_id format: YYYYMMDD0XXX where XXX is home team code
-            home_code = game_id[9:12] if len(game_id) >= 12 else ''
-
-            # Get unique teams from this game's players
-            teams_in_game = group['team'].unique().tolist()
-
-            # Try to match home team by code
-            home_team = ''
-            away_team = ''
-            for t in teams_in_game:
-                t_code = _get_team_code_from_name(t)
-                if t_code and t_code.upper() == home_code.upper():
-                    home_team = t
-                else:
-                    away_team = t
-
-            # If we couldn't determine, just use what we have
-            if not home_team and teams_in_game:
-                home_team = teams_in_game[0]
-            if not away_team and len(teams_in_game) > 1:
-                away_team = teams_in_game[1]
-
-            # Get scores from player data
-            home_players = group[group['team'] == home_team] if home_team else group
-            away_players = group[group['team'] == away_team] if away_team else group
-
-            # Parse score from first player of each team
-            home_score = 0
-            away_score = 0
-            if not home_players.empty:
-                score_str = home_players.iloc[0].get('score', '')
-                if score_str and '-' in str(score_str):
-                    parts = str(score_str).split('-')
-                    home_score = int(parts[0]) if home_players.iloc[0].get('team') == home_team else int(parts[1])
-                    away_score = int(parts[1]) if home_players.iloc[0].get('team') == home_team else int(parts[0])
+            away_team, home_team, away_score, home_score = _infer_home_away(game_id, team_rows.get(game_id, []))
 
         game_dict = {
             'game_id': game_id,
-            'date': first.get('date', ''),
-            'date_yyyymmdd': first.get('date_yyyymmdd', ''),
+            'date': date,
+            'date_yyyymmdd': date_yyyymmdd,
             'away_team': away_team,
             'home_team': home_team,
             'away_score': away_score,
             'home_score': home_score,
-            'game_type': first.get('game_type', 'regular'),
-            'players': len(group),
+            'game_type': game_type,
+            'players': players,
         }
 
         # Attach ESPN PBP analysis if available
@@ -386,11 +899,49 @@ def _build_games_summary(games_df: pd.DataFrame, all_games: List[Dict] = None) -
 
         games.append(game_dict)
 
-    # Sort by date descending (use date_yyyymmdd for proper sorting)
-    games.sort(key=lambda x: x.get('date_yyyymmdd', ''), reverse=True)
     return games
 
 
+def _infer_home_away(game_id: str, team_rows: List[tuple]) -> tuple:
+    """
+    Work out (away_team, home_team, away_score, home_score) from player rows
+    when the original game data is unavailable.
+
+    Args:
+        game_id: Game ID in YYYYMMDD0XXX format, where XXX is the home team code
+        team_rows: (team, score) from each team's first player row, in order
+    """
+    home_code = game_id[9:12] if len(game_id) >= 12 else ''
+    teams_in_game = [team for team, _ in team_rows]
+
+    # Try to match home team by code
+    home_team = ''
+    away_team = ''
+    for t in teams_in_game:
+        t_code = _get_team_code_from_name(t)
+        if t_code and t_code.upper() == home_code.upper():
+            home_team = t
+        else:
+            away_team = t
+
+    # If we couldn't determine, just use what we have
+    if not home_team and teams_in_game:
+        home_team = teams_in_game[0]
+    if not away_team and len(teams_in_game) > 1:
+        away_team = teams_in_game[1]
+
+    # Parse score from the home team's first player (score is "team-opp")
+    home_score = 0
+    away_score = 0
+    score_str = next((score for team, score in team_rows if team == home_team), '')
+    if score_str and '-' in str(score_str):
+        parts = str(score_str).split('-')
+        home_score = int(parts[0])
+        away_score = int(parts[1])
+
+    return away_team, home_team, away_score, home_score
+
+
 def _normalize_team_code(code: str) -> str:
     """Normalize team code using aliases."""
     if not code:
@@ -524,85 +1075,72 @@ def _calculate_venue_stats(games_df: pd.DataFrame) -> Dict[str, Any]:
     else:
         unique_games = games_df
 
-    visited_codes: Set[str] = set()
-    visited_cities: Set[str] = set()
-    visited_states: Set[str] = set()
-    venue_games: Dict[str, List] = {}
+    game_ids = unique_games['game_id'].astype(str) if 'game_id' in unique_games.columns else pd.Series('', index=unique_games.index)
+    dates = unique_games['date'].astype(str) if 'date' in unique_games.columns else pd.Series('', index=unique_games.index)
 
-    for _, game in unique_games.iterrows():
-        game_id = str(game.get('game_id', ''))
-        date_str = str(game.get('date', ''))
+    # Home team code from game_id (YYYYMMDD0XXX)
+    has_home = (game_ids.str.len() >= 12) & (game_ids.str.slice(8, 9) == '0')
+    home_codes = game_ids.str.slice(9, 12).str.upper()
 
-        home_code = None
-        if len(game_id) >= 12 and game_id[8] == '0':
-            home_code = game_id[9:12].upper()
+    # Year is the text after the last comma ("January 5, 2024"), else the
+    # first four characters; anything that isn't an integer is unknown
+    year_text = dates.str.rsplit(',', n=1).str[-1].where(dates.str.contains(',', regex=False), dates.str.slice(0, 4))
+    year_text = year_text.str.strip().where(dates.str.len() >= 4, '')
+    years = pd.to_numeric(year_text.where(year_text.str.fullmatch(r'[+-]?\d+'), None), errors='coerce')
 
-        if not home_code:
-            continue
+    # The Clippers shared the Lakers' arena until Intuit Dome opened in 2024
+    shared_arena = (home_codes == 'LAC') & years.notna() & (years != 0) & (years < 2024)
+    arena_codes = home_codes.mask(shared_arena, 'LAL')
 
-        actual_arena_code = home_code
-        year = None
-        if date_str and len(date_str) >= 4:
-            try:
-                year = int(date_str.split(',')[-1].strip()) if ',' in date_str else int(date_str[:4])
-            except:
-                pass
-
-        if home_code == 'LAC' and year and year < 2024:
-            actual_arena_code = 'LAL'
-
-        if actual_arena_code in NBA_ARENAS:
-            arena = NBA_ARENAS[actual_arena_code]
-            visited_codes.add(actual_arena_code)
-            visited_cities.add(arena['city'])
-            visited_states.add(arena['state'])
-
-            if actual_arena_code not in venue_games:
-                venue_games[actual_arena_code] = []
-            venue_games[actual_arena_code].append({'date': date_str, 'game_id': game_id})
-
-    venues = []
-    for code, arena in NBA_ARENAS.items():
-        games = venue_games.get(code, [])
-        venues.append({
-            'code': code,
-            'name': arena['name'],
-            'team': arena['team'],
-            'city': arena['city'],
-            'state': arena['state'],
-            'lat': arena['lat'],
-            'lng': arena['lng'],
-            'visited': code in visited_codes,
-            'games': len(games),
-            'first_visit': min(g['date'] for g in games) if games else None,
-            'last_visit': max(g['date'] for g in games) if games else None,
-        })
+    visits = pd.DataFrame({'code': arena_codes, 'date': dates})
+    visits = visits[has_home & arena_codes.isin(NBA_ARENAS.keys())]
+    stats = visits.groupby('code')['date'].agg(games='size', first_visit='min', last_visit='max')
+
+    venues_df = _ARENAS_DF.merge(stats, left_on='code', right_index=True, how='left')
+    venues_df['games'] = venues_df['games'].fillna(0).astype(int)
+    venues_df.insert(venues_df.columns.get_loc('games'), 'visited', venues_df['games'] > 0)
+    for col in ('first_visit', 'last_visit'):
+        venues_df[col] = venues_df[col].astype(object).where(venues_df[col].notna(), None)
+    visited = venues_df[venues_df['visited']]
 
     return {
-        'venues': venues,
-        'arenas_visited': len(visited_codes),
-        'states_visited': len(visited_states),
-        'cities_visited': len(visited_cities),
+        'venues': venues_df.to_dict(orient='records'),
+        'arenas_visited': len(visited),
+        'states_visited': visited['state'].nunique(),
+        'cities_visited': visited['city'].nunique(),
     }
 
 
-def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
-    generated_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-    return f'''<!DOCTYPE html>
+# Page template. The data payload is written to nba_data.json and fetched by
+# the page (preloaded from the head so the request starts before app.js runs).
+# The CSS and JavaScript are written as content-hashed files next to the page
+# (see _write_hashed_asset) and linked from the head; the theme bootstrap
+# stays inline so the first paint already has the right theme. Placeholders
+# are small scalars only.
+_HEAD_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>NBA Stats Tracker</title>
     <link rel="stylesheet" href="https://unpkg.com/leaflet@1.9.4/dist/leaflet.css" />
+    <link rel="preload" href="{data_href}" as="fetch" crossorigin="anonymous" id="nba-data">
+    <link rel="stylesheet" href="{css_href}">
+    <script>
+(function() {{
+    const saved = localStorage.getItem('theme');
+    if (saved) document.documentElement.setAttribute('data-theme', saved);
+    else if (window.matchMedia('(prefers-color-scheme: dark)').matches)
+        document.documentElement.setAttribute('data-theme', 'dark');
+}})();
+    </script>
     <script src="https://unpkg.com/leaflet@1.9.4/dist/leaflet.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-{_get_css()}
-    </style>
+    <script src="{js_href}" defer></script>
 </head>
-<body>
+'''
+
+_BODY_HTML = '''<body>
     <header class="header">
         <div class="header-controls">
             <div class="global-search-container">
@@ -620,10 +1158,10 @@ def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
                 <svg class="progress-ring" viewBox="0 0 100 100">
                     <circle class="progress-ring-bg" cx="50" cy="50" r="42"/>
                     <circle class="progress-ring-fill" cx="50" cy="50" r="42"
-                        style="--progress: {(summary.get('teamsSeen', 0) / 30) * 100}"/>
+                        style="--progress: {teams_progress}"/>
                 </svg>
                 <div class="progress-ring-text">
-                    <div class="progress-ring-value">{summary.get('teamsSeen', 0)}<span class="progress-ring-total">/30</span></div>
+                    <div class="progress-ring-value">{teams_seen}<span class="progress-ring-total">/30</span></div>
                     <div class="progress-ring-label">Teams</div>
                 </div>
             </div>
@@ -631,10 +1169,10 @@ def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
                 <svg class="progress-ring" viewBox="0 0 100 100">
                     <circle class="progress-ring-bg" cx="50" cy="50" r="42"/>
                     <circle class="progress-ring-fill arenas" cx="50" cy="50" r="42"
-                        style="--progress: {(summary.get('arenasVisited', 0) / 30) * 100}"/>
+                        style="--progress: {arenas_progress}"/>
                 </svg>
                 <div class="progress-ring-text">
-                    <div class="progress-ring-value">{summary.get('arenasVisited', 0)}<span class="progress-ring-total">/30</span></div>
+                    <div class="progress-ring-value">{arenas_visited}<span class="progress-ring-total">/30</span></div>
                     <div class="progress-ring-label">Arenas</div>
                 </div>
             </div>
@@ -642,24 +1180,24 @@ def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
                 <svg class="progress-ring" viewBox="0 0 100 100">
                     <circle class="progress-ring-bg" cx="50" cy="50" r="42"/>
                     <circle class="progress-ring-fill milestones" cx="50" cy="50" r="42"
-                        style="--progress: {min((summary.get('totalMilestones', 0) / 100) * 100, 100)}"/>
+                        style="--progress: {milestones_progress}"/>
                 </svg>
                 <div class="progress-ring-text">
-                    <div class="progress-ring-value">{summary.get('totalMilestones', 0)}</div>
+                    <div class="progress-ring-value">{total_milestones}</div>
                     <div class="progress-ring-label">Milestones</div>
                 </div>
             </div>
             <div class="stats-column">
                 <div class="mini-stat">
-                    <span class="mini-stat-value">{summary.get('totalGames', 0)}</span>
+                    <span class="mini-stat-value">{total_games}</span>
                     <span class="mini-stat-label">Games</span>
                 </div>
                 <div class="mini-stat">
-                    <span class="mini-stat-value">{summary.get('totalPlayers', 0)}</span>
+                    <span class="mini-stat-value">{total_players}</span>
                     <span class="mini-stat-label">Players</span>
                 </div>
                 <div class="mini-stat">
-                    <span class="mini-stat-value">{summary.get('statesVisited', 0)}</span>
+                    <span class="mini-stat-value">{states_visited}</span>
                     <span class="mini-stat-label">States</span>
                 </div>
             </div>
@@ -706,15 +1244,15 @@ def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
             <div class="filters">
                 <div class="filter-group">
                     <label>Search</label>
-                    <input type="text" id="players-search" placeholder="Search..." onkeyup="filterPlayersTable()">
+                    <input type="text" id="players-search" placeholder="Search..." onkeyup="schedulePlayersFilter()">
                 </div>
                 <div class="filter-group">
                     <label>Team</label>
-                    <select id="players-team" onchange="filterPlayersTable()"><option value="">All Teams</option></select>
+                    <select id="players-team" onchange="schedulePlayersFilter()"><option value="">All Teams</option></select>
                 </div>
                 <div class="filter-group">
                     <label>Min Games</label>
-                    <input type="number" id="players-min-games" min="1" placeholder="1" onchange="filterPlayersTable()">
+                    <input type="number" id="players-min-games" min="1" placeholder="1" onchange="schedulePlayersFilter()">
                 </div>
                 <button class="clear-filters" onclick="clearPlayersFilters()">Clear</button>
             </div>
@@ -860,7 +1398,7 @@ def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
             <div class="filters">
                 <div class="filter-group">
                     <label>Show</label>
-                    <select id="venues-filter" onchange="filterVenuesTable()">
+                    <select id="venues-filter" onchange="scheduleVenuesFilter()">
                         <option value="all">All Arenas</option>
                         <option value="visited">Visited Only</option>
                         <option value="unvisited">Not Visited</option>
@@ -893,28 +1431,15 @@ def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
 
         <!-- Achievements Section -->
         <div id="achievements" class="section">
-            <h2>Milestones & Achievements ({summary.get('totalMilestones', 0)} total)</h2>
+            <h2>Milestones & Achievements ({total_milestones} total)</h2>
             <div class="milestone-filters">
                 <div class="filter-group">
                     <label>Category</label>
-                    <select id="milestone-category" onchange="filterMilestones()">
-                        <option value="all">All Categories</option>
-                        <option value="multi">Multi-Category</option>
-                        <option value="scoring">Scoring</option>
-                        <option value="rebounding">Rebounding</option>
-                        <option value="assists">Assists</option>
-                        <option value="steals">Steals</option>
-                        <option value="blocks">Blocks</option>
-                        <option value="threes">Three-Pointers</option>
-                        <option value="efficiency">Efficiency</option>
-                        <option value="combined">Combined</option>
-                        <option value="defensive">Defensive</option>
-                        <option value="plusminus">Plus/Minus</option>
-                    </select>
+                    <select id="milestone-category" onchange="filterMilestones()"></select>
                 </div>
                 <div class="filter-group">
                     <label>Search Player</label>
-                    <input type="text" id="milestone-search" placeholder="Search..." onkeyup="filterMilestones()">
+                    <input type="text" id="milestone-search" placeholder="Search...">
                 </div>
             </div>
             <div id="milestones-container" class="milestones-container"></div>
@@ -922,20 +1447,16 @@ def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
 
         <!-- Career Firsts Section -->
         <div id="career-firsts" class="section">
-            <h2>Career Firsts & Milestones ({summary.get('careerFirsts', 0)} witnessed)</h2>
+            <h2>Career Firsts & Milestones ({career_firsts} witnessed)</h2>
             <p class="section-description">Career milestones you witnessed players achieve - first career points, 1000th career rebound, etc.</p>
             <div class="milestone-filters">
                 <div class="filter-group">
                     <label>Category</label>
-                    <select id="career-firsts-category" onchange="filterCareerFirsts()">
-                        <option value="all">All</option>
-                        <option value="first">Career Firsts</option>
-                        <option value="milestone">Career Milestones</option>
-                    </select>
+                    <select id="career-firsts-category" onchange="filterCareerFirsts()"></select>
                 </div>
                 <div class="filter-group">
                     <label>Search Player</label>
-                    <input type="text" id="career-firsts-search" placeholder="Search..." onkeyup="filterCareerFirsts()">
+                    <input type="text" id="career-firsts-search" placeholder="Search...">
                 </div>
             </div>
             <div id="career-firsts-container" class="milestones-container"></div>
@@ -943,25 +1464,25 @@ def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
     </div>
 
     <!-- Box Score Modal -->
-    <div class="modal" id="boxscore-modal" onclick="if(event.target === this) closeModal('boxscore-modal')">
+    <div class="modal" id="boxscore-modal" data-modal-dismiss>
         <div class="modal-content modal-large">
-            <button class="modal-close" onclick="closeModal('boxscore-modal')">&times;</button>
+            <button class="modal-close" data-action="close-modal">&times;</button>
             <div id="boxscore-detail"></div>
         </div>
     </div>
 
     <!-- Player Modal -->
-    <div class="modal" id="player-modal" onclick="if(event.target === this) closeModal('player-modal')">
+    <div class="modal" id="player-modal" data-modal-dismiss>
         <div class="modal-content">
-            <button class="modal-close" onclick="closeModal('player-modal')">&times;</button>
+            <button class="modal-close" data-action="close-modal">&times;</button>
             <div id="player-detail"></div>
         </div>
     </div>
 
     <!-- Day Games Modal -->
-    <div class="modal" id="day-games-modal" onclick="if(event.target === this) closeModal('day-games-modal')">
+    <div class="modal" id="day-games-modal" data-modal-dismiss>
         <div class="modal-content">
-            <button class="modal-close" onclick="closeModal('day-games-modal')">&times;</button>
+            <button class="modal-close" data-action="close-modal">&times;</button>
             <div id="day-games-detail"></div>
         </div>
     </div>
@@ -969,12 +1490,62 @@ def _generate_html(json_data: str, summary: Dict[str, Any]) -> str:
     <div id="toast" class="toast"></div>
 
     <footer><p>Generated: {generated_time}</p></footer>
-
-    <script>
-const DATA = {json_data};
-{_get_javascript()}
-    </script>
 </body>
 </html>'''
 
 
+# Per-build values in the page template; everything else is static
+_HTML_FIELDS = (
+    'css_href', 'js_href', 'data_href', 'teams_seen', 'teams_progress',
+    'arenas_visited', 'arenas_progress', 'total_milestones', 'milestones_progress',
+    'total_games', 'total_players', 'states_visited', 'career_firsts', 'generated_time',
+)
+_HTML_FIELD_RE = re.compile(rb'\{(' + b'|'.join(f.encode() for f in _HTML_FIELDS) + rb')\}')
+# Characters an unquoted attribute value may not contain
+_UNQUOTED_ATTR_UNSAFE = re.compile(r'[\s"\'=<>`]')
+
+
+def _compile_html() -> List[bytes]:
+    """
+    Minify the page template once, placeholders included, and split it into
+    static byte chunks alternating with field names.
+    """
+    html = (_HEAD_HTML + _BODY_HTML).format(**{f: '{' + f + '}' for f in _HTML_FIELDS})
+    return _HTML_FIELD_RE.split(_minify_html(html).encode('utf-8'))
+
+
+_HTML_PARTS = _compile_html()
+
+
+def _generate_html(summary: Dict[str, Any], css_href: str, js_href: str, data_href: str) -> bytes:
+    teams_seen = summary.get('teamsSeen', 0)
+    arenas_visited = summary.get('arenasVisited', 0)
+    total_milestones = summary.get('totalMilestones', 0)
+    # Progress values are written as the CSS minifier would have written them
+    fields = {
+        'css_href': css_href,
+        'js_href': js_href,
+        'data_href': data_href,
+        'teams_seen': teams_seen,
+        'teams_progress': f'{(teams_seen / 30) * 100:g}',
+        'arenas_visited': arenas_visited,
+        'arenas_progress': f'{(arenas_visited / 30) * 100:g}',
+        'total_milestones': total_milestones,
+        'milestones_progress': f'{min((total_milestones / 100) * 100, 100):g}',
+        'total_games': summary.get('totalGames', 0),
+        'total_players': summary.get('totalPlayers', 0),
+        'states_visited': summary.get('statesVisited', 0),
+        'career_firsts': summary.get('careerFirsts', 0),
+        'generated_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    parts = list(_HTML_PARTS)
+    for i in range(1, len(parts), 2):
+        value = str(fields[parts[i].decode()])
+        # The minifier saw only the placeholder, so it may have left the
+        # attribute unquoted
+        if parts[i - 1].endswith(b'=') and _UNQUOTED_ATTR_UNSAFE.search(value):
+            value = '"' + value.replace('"', '&quot;') + '"'
+        parts[i] = value.encode('utf-8')
+    return b''.join(parts)
+
+
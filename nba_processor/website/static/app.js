@@ -1,20 +1,164 @@
-// Auto-generated constants from Python
-const TEAM_SHORT_NAMES = {"Boston Celtics": "Celtics", "Brooklyn Nets": "Nets", "New York Knicks": "Knicks", "Philadelphia 76ers": "76ers", "Toronto Raptors": "Raptors", "Chicago Bulls": "Bulls", "Cleveland Cavaliers": "Cavaliers", "Detroit Pistons": "Pistons", "Indiana Pacers": "Pacers", "Milwaukee Bucks": "Bucks", "Atlanta Hawks": "Hawks", "Charlotte Hornets": "Hornets", "Miami Heat": "Heat", "Orlando Magic": "Magic", "Washington Wizards": "Wizards", "Denver Nuggets": "Nuggets", "Minnesota Timberwolves": "Timberwolves", "Oklahoma City Thunder": "Thunder", "Portland Trail Blazers": "Trail Blazers", "Utah Jazz": "Jazz", "Golden State Warriors": "Warriors", "Los Angeles Clippers": "Clippers", "Los Angeles Lakers": "Lakers", "Phoenix Suns": "Suns", "Sacramento Kings": "Kings", "Dallas Mavericks": "Mavericks", "Houston Rockets": "Rockets", "Memphis Grizzlies": "Grizzlies", "New Orleans Pelicans": "Pelicans", "San Antonio Spurs": "Spurs"};
-const TEAM_CODES = {"Boston Celtics": "BOS", "Brooklyn Nets": "BKN", "New York Knicks": "NYK", "Philadelphia 76ers": "PHI", "Toronto Raptors": "TOR", "Chicago Bulls": "CHI", "Cleveland Cavaliers": "CLE", "Detroit Pistons": "DET", "Indiana Pacers": "IND", "Milwaukee Bucks": "MIL", "Atlanta Hawks": "ATL", "Charlotte Hornets": "CHA", "Miami Heat": "MIA", "Orlando Magic": "ORL", "Washington Wizards": "WAS", "Denver Nuggets": "DEN", "Minnesota Timberwolves": "MIN", "Oklahoma City Thunder": "OKC", "Portland Trail Blazers": "POR", "Utah Jazz": "UTA", "Golden State Warriors": "GSW", "Los Angeles Clippers": "LAC", "Los Angeles Lakers": "LAL", "Phoenix Suns": "PHX", "Sacramento Kings": "SAC", "Dallas Mavericks": "DAL", "Houston Rockets": "HOU", "Memphis Grizzlies": "MEM", "New Orleans Pelicans": "NOP", "San Antonio Spurs": "SAS"};
-const MILESTONE_CATEGORIES = {"multi": ["quadruple_doubles", "triple_doubles", "double_doubles", "near_triple_doubles", "near_double_doubles", "five_by_fives", "all_around_games"], "scoring": ["seventy_point_games", "sixty_point_games", "fifty_point_games", "forty_five_point_games", "forty_point_games", "thirty_five_point_games", "thirty_point_games", "twenty_five_point_games", "twenty_point_games"], "rebounding": ["twenty_five_rebound_games", "twenty_rebound_games", "eighteen_rebound_games", "fifteen_rebound_games", "twelve_rebound_games", "ten_rebound_games"], "assists": ["twenty_assist_games", "fifteen_assist_games", "twelve_assist_games", "ten_assist_games"], "steals": ["ten_steal_games", "seven_steal_games", "five_steal_games", "four_steal_games"], "blocks": ["ten_block_games", "seven_block_games", "five_block_games", "four_block_games"], "threes": ["ten_three_games", "eight_three_games", "seven_three_games", "six_three_games", "five_three_games", "perfect_from_three"], "efficiency": ["hot_shooting_games", "perfect_ft_games", "perfect_fg_games", "efficient_scoring_games", "high_game_score"], "combined": ["thirty_ten_games", "twenty_five_ten_games", "twenty_ten_games", "twenty_ten_five_games", "twenty_twenty_games", "points_assists_double_double"], "defensive": ["defensive_monster_games", "zero_turnover_games"], "plusminus": ["plus_25_games", "plus_20_games", "minus_25_games"]};
+// Elements of the static page, looked up once. Only for ids in the page
+// template: nodes created later through innerHTML would go stale here.
+const EL = {};
+function $(id) {
+    return EL[id] || (EL[id] = document.getElementById(id));
+}
+
+// Escape text for HTML markup, including attribute values (matches
+// Python's html.escape, which the generator uses for prerendered markup)
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;' };
+function escapeHtml(value) {
+    return String(value ?? '').replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+}
+
+// Scratch fragment for replaceRows; inserting it leaves it empty for reuse
+const rowsFrag = document.createDocumentFragment();
 
-function getShortName(fullName) {
-    return TEAM_SHORT_NAMES[fullName] || fullName;
+// Replace a tbody's rows with one built per item, in a single DOM update
+function replaceRows(tbody, items, buildRow) {
+    for (const item of items) rowsFrag.appendChild(buildRow(item));
+    tbody.replaceChildren(rowsFrag);
+}
+
+// Build a <tr> of text cells; a cell is a value or [value, className]
+function textRow(cells) {
+    const tr = document.createElement('tr');
+    for (const cell of cells) {
+        const td = document.createElement('td');
+        if (Array.isArray(cell)) {
+            td.textContent = cell[0];
+            td.className = cell[1];
+        } else {
+            td.textContent = cell;
+        }
+        tr.appendChild(td);
+    }
+    return tr;
 }
 
-function getTeamCode(fullName) {
-    if (fullName && fullName.includes(', ')) {
-        return fullName.split(', ').map(t => TEAM_CODES[t.trim()] || t.trim().slice(0,3).toUpperCase()).join(', ');
+// Rows rendered beyond each edge of a VirtualTable's viewport
+const VIRTUAL_OVERSCAN = 8;
+
+// Scrolling table that keeps only the rows in view in the DOM. A pool of <tr>
+// nodes is refilled in place as the container scrolls (at most once per
+// frame); spacer rows above and below stand in for the rest. Rows are kept
+// single-line (.virtual-table) so they all share the measured row height.
+class VirtualTable {
+    constructor(container, tbody, columns, rowHeight, fillRow, emptyText = '') {
+        this.container = container;
+        this.tbody = tbody;
+        this.columns = columns;
+        this.rowHeight = rowHeight;
+        this.fillRow = fillRow;
+        this.emptyText = emptyText;
+        this.rows = [];
+        this.pool = [];
+        this.start = -1;
+        this.measured = false;
+        this.frame = 0;
+        tbody.parentNode.classList.add('virtual-table');
+        tbody.textContent = '';
+        this.top = tbody.appendChild(this.spacer());
+        this.bottom = tbody.appendChild(this.spacer());
+        container.addEventListener('scroll', () => {
+            if (!this.frame) this.frame = requestAnimationFrame(() => { this.frame = 0; this.render(); });
+        }, { passive: true });
+    }
+
+    spacer() {
+        const tr = document.createElement('tr');
+        tr.className = 'virtual-spacer';
+        tr.appendChild(document.createElement('td')).colSpan = this.columns;
+        return tr;
     }
-    return TEAM_CODES[fullName] || fullName;
+
+    setRows(rows) {
+        this.rows = rows;
+        this.start = -1;
+        this.container.scrollTop = 0;
+        this.render();
+    }
+
+    render() {
+        const n = this.rows.length;
+        const viewport = this.container.clientHeight || window.innerHeight;
+        const size = Math.min(n, Math.ceil(viewport / this.rowHeight) + 2 * VIRTUAL_OVERSCAN);
+        const first = Math.floor(this.container.scrollTop / this.rowHeight) - VIRTUAL_OVERSCAN;
+        const start = Math.max(0, Math.min(n - size, first));
+        if (start === this.start && size === this.pool.length) return;
+
+        while (this.pool.length < size) {
+            const tr = document.createElement('tr');
+            for (let c = 0; c < this.columns; c++) tr.appendChild(document.createElement('td'));
+            this.pool.push(this.tbody.insertBefore(tr, this.bottom));
+        }
+        while (this.pool.length > size) this.pool.pop().remove();
+        for (let i = 0; i < size; i++) this.fillRow(this.pool[i], this.rows[start + i]);
+        this.start = start;
+        this.top.firstChild.style.height = `${start * this.rowHeight}px`;
+        this.bottom.firstChild.style.height = `${(n - start - size) * this.rowHeight}px`;
+        this.top.classList.toggle('virtual-empty', n === 0);
+        this.top.firstChild.textContent = n === 0 ? this.emptyText : '';
+
+        // Switch to the real row height once a row has been laid out
+        if (!this.measured && size) {
+            const height = this.pool[0].getBoundingClientRect().height;
+            if (height) {
+                this.measured = true;
+                if (Math.abs(height - this.rowHeight) > 0.5) {
+                    this.rowHeight = height;
+                    this.start = -1;
+                    this.render();
+                }
+            }
+        }
+    }
+}
+
+// Decode a base64 column of little-endian numbers (see _b64_array) into a
+// typed array; every platform browsers run on is little-endian
+function b64Array(b64, Type) {
+    const bin = atob(b64 || '');
+    const bytes = new Uint8Array(bin.length);
+    for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+    return new Type(bytes.buffer);
+}
+
+// Typed array for each packed integer column tag (see _pack_int_column)
+const PACKED_TYPES = { i1: Int8Array, i2: Int16Array, i4: Int32Array };
+
+// Expand a column-wise table ({columns, data}) into row objects. Categorical
+// columns arrive as {categories, codes}, with -1 for a missing value, and
+// integer columns as base64 {dtype, b64}.
+function tableRows(table) {
+    if (!table || Array.isArray(table)) return table || [];
+    const cols = table.data.map(c => c.codes ? c.codes.map(i => i < 0 ? null : c.categories[i])
+        : c.b64 !== undefined ? b64Array(c.b64, PACKED_TYPES[c.dtype]) : c);
+    const n = cols.length ? cols[0].length : 0;
+    const rows = new Array(n);
+    for (let i = 0; i < n; i++) {
+        const row = {};
+        for (let c = 0; c < cols.length; c++) row[table.columns[c]] = cols[c][i];
+        rows[i] = row;
+    }
+    return rows;
+}
+
+// Page data lives in nba_data.json. The head preloads it (link#nba-data), so
+// this fetch reuses that response; rendering starts once it has arrived.
+let DATA = {};
+function loadData() {
+    const link = document.getElementById('nba-data');
+    return fetch(link ? link.href : 'nba_data.json').then(r => {
+        if (!r.ok) throw new Error(`Failed to load data: HTTP ${r.status}`);
+        return r.json();
+    });
 }
+const dataReady = loadData();
 
 let arenaMap = null;
+let playerRows = [];
 let filteredPlayers = [];
 let playerSortCol = null;
 let playerSortAsc = false;
@@ -35,12 +179,6 @@ function toggleTheme() {
     localStorage.setItem('theme', newTheme);
     if (arenaMap) setTimeout(() => arenaMap.invalidateSize(), 100);
 }
-(function() {
-    const saved = localStorage.getItem('theme');
-    if (saved) document.documentElement.setAttribute('data-theme', saved);
-    else if (window.matchMedia('(prefers-color-scheme: dark)').matches)
-        document.documentElement.setAttribute('data-theme', 'dark');
-})();
 
 // URL Deep Linking
 let _suppressURLUpdate = false;
@@ -93,8 +231,8 @@ function showSection(id) {
     document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
     document.querySelectorAll('.section').forEach(s => s.classList.remove('active'));
     document.querySelector(`[data-section="${id}"]`).classList.add('active');
-    document.getElementById(id).classList.add('active');
-    if (id === 'map' && !arenaMap) initMap();
+    $(id).classList.add('active');
+    if (id === 'map' && !window.IntersectionObserver) initMap();
     if (id === 'records' && !recordsInitialized) { recordsInitialized = true; renderRecords(); renderPlayerRecords(); }
     if (id === 'scorigami' && !scorigamiInitialized) { scorigamiInitialized = true; renderScorigami(); }
     if (id === 'matchups' && !matchupsInitialized) { matchupsInitialized = true; renderMatchups(); }
@@ -105,10 +243,10 @@ function showSection(id) {
 }
 
 // Modals
-function openModal(id) { document.getElementById(id).classList.add('active'); document.body.style.overflow = 'hidden'; }
-function closeModal(id) { document.getElementById(id).classList.remove('active'); document.body.style.overflow = ''; }
+function openModal(id) { $(id).classList.add('active'); document.body.style.overflow = 'hidden'; }
+function closeModal(id) { $(id).classList.remove('active'); document.body.style.overflow = ''; }
 function showToast(msg) {
-    const t = document.getElementById('toast');
+    const t = $('toast');
     t.textContent = msg; t.classList.add('show');
     setTimeout(() => t.classList.remove('show'), 3000);
 }
@@ -116,10 +254,10 @@ function showToast(msg) {
 // Games Grid
 function renderGamesGrid() {
     const games = DATA.games || [];
-    const grid = document.getElementById('games-grid');
+    const grid = $('games-grid');
 
     if (!games.length) {
-        grid.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No games found</p>';
+        grid.innerHTML = EMPTY.games;
         return;
     }
 
@@ -136,7 +274,7 @@ function renderGamesGrid() {
         const homeClass = !awayWon ? 'win' : '';
 
         return `
-        <div class="game-card" onclick="showBoxScore('${g.game_id}')">
+        <div class="game-card" data-game="${g.game_id}">
             <div class="game-card-date">${g.date}${gameType}</div>
             <div class="game-card-matchup">
                 <span class="team-score ${awayClass}">${awayTeam} <strong>${awayScore}</strong></span>
@@ -147,6 +285,39 @@ function renderGamesGrid() {
     }).join('');
 }
 
+// Collapse bursts of calls (e.g. keystrokes) into one call after `ms` of quiet
+const debounce = (fn, ms) => {
+    let t;
+    return (...args) => { clearTimeout(t); t = setTimeout(() => fn(...args), ms); };
+};
+const SEARCH_DEBOUNCE_MS = 120;
+
+// Empty-state markup, built once instead of on every render that finds nothing
+const emptyMessage = text => `<p style="text-align:center;padding:2rem;color:var(--text-muted);">${text}</p>`;
+const EMPTY = {
+    games: emptyMessage('No games found'),
+    playerData: emptyMessage('No player data'),
+    milestones: emptyMessage('No milestones found'),
+    milestoneCard: '<p class="empty">None recorded</p>',
+    careerFirsts: emptyMessage('No career firsts found.'),
+    careerFirstsMissing: emptyMessage('No career firsts found. Run the career firsts scraper to populate this data.'),
+    careerFirstsFiltered: emptyMessage('No matching career firsts found.'),
+    pbpData: emptyMessage('No PBP data available'),
+    pbpRecords: emptyMessage('No PBP records available'),
+    teamsPicked: emptyMessage('Select two different teams'),
+    search: '<div class="search-no-results">No results found</div>',
+};
+
+// Run fn at most once per animation frame, however often it is requested
+const rafThrottle = fn => {
+    let pending = false;
+    return () => {
+        if (pending) return;
+        pending = true;
+        requestAnimationFrame(() => { pending = false; fn(); });
+    };
+};
+
 // Format minutes (handles both decimal and MM:SS formats)
 function formatMinutes(mp) {
     if (mp == null || mp === '' || mp === '-') return '-';
@@ -189,7 +360,7 @@ function showBoxScore(gameId) {
 
     if (!playerGames.length) { showToast('No box score data'); return; }
 
-    const detail = document.getElementById('boxscore-detail');
+    const detail = $('boxscore-detail');
     const gameType = gameInfo?.game_type && gameInfo.game_type !== 'regular' ? ` (${gameInfo.game_type})` : '';
 
     // Get away/home info
@@ -294,18 +465,12 @@ function showBoxScore(gameId) {
 
         // Starters
         if (roster.starters.length > 0) {
-            html += `<tr class="roster-divider"><td colspan="12">Starters</td></tr>`;
-            roster.starters.forEach(p => {
-                html += renderBoxScoreRow(p);
-            });
+            html += `<tr class="roster-divider"><td colspan="12">Starters</td></tr>` + roster.starters.map(renderBoxScoreRow).join('');
         }
 
         // Bench
         if (roster.bench.length > 0) {
-            html += `<tr class="roster-divider"><td colspan="12">Bench</td></tr>`;
-            roster.bench.forEach(p => {
-                html += renderBoxScoreRow(p);
-            });
+            html += `<tr class="roster-divider"><td colspan="12">Bench</td></tr>` + roster.bench.map(renderBoxScoreRow).join('');
         }
 
         html += '</tbody></table></div></div>';
@@ -317,7 +482,7 @@ function showBoxScore(gameId) {
 
 function renderBoxScoreRow(p) {
     return `<tr>
-        <td><span class="player-link" onclick="event.stopPropagation();showPlayerDetail('${(p.player||'').replace(/'/g, "\'")}')">${p.player}</span></td>
+        <td><span class="player-link" data-player="${escapeHtml(p.player)}">${p.player}</span></td>
         <td class="num">${formatMinutes(p.mp)}</td>
         <td class="num">${p.pts || 0}</td>
         <td class="num">${p.trb || 0}</td>
@@ -337,6 +502,11 @@ const playerCols = [
     'Player', 'Team', 'Games', 'MPG', 'PPG', 'RPG', 'APG', 'SPG', 'BPG', 'TOPG',
     'FG%', '3P%', 'FT%', 'TS%', 'eFG%', 'Total PTS', 'Total REB', 'Total AST', 'Total +/-'
 ];
+// Player rows are arrays in playerCols order (PLAYER_COLUMNS in generator.py);
+// PC maps a column name to its index
+const PC = Object.fromEntries(playerCols.map((c, i) => [c, i]));
+// After the columns, each row carries its precomputed CSV line
+const CSV_COL = playerCols.length;
 
 // Tooltips for stat abbreviations
 const statTooltips = {
@@ -363,6 +533,10 @@ const perGameCols = ['MPG', 'PPG', 'RPG', 'APG', 'SPG', 'BPG', 'TOPG'];
 // Columns that should show 3 decimals (percentages)
 const pctCols = ['FG%', '3P%', 'FT%', 'TS%', 'eFG%'];
 
+// Shared stat formatters: one decimal, and a fraction as a one-decimal percentage
+const fmt1 = v => v.toFixed(1);
+const fmtPct = v => `${(v * 100).toFixed(1)}%`;
+
 function formatStatValue(val, col) {
     if (val == null || val === '') return '';
     if (typeof val !== 'number') return val;
@@ -371,40 +545,41 @@ function formatStatValue(val, col) {
     return Number.isInteger(val) ? val : val.toFixed(1);
 }
 
-function renderPlayersTable() {
-    const table = document.getElementById('players-table');
-    const data = filteredPlayers;
+let playersView = null;
 
-    if (!data || !data.length) {
-        table.innerHTML = '<tr><td colspan="20" style="text-align:center;padding:2rem;">No players</td></tr>';
-        return;
-    }
-
-    let html = '<thead><tr>' + playerCols.map(c => {
+function renderPlayersTable() {
+    const table = $('players-table');
+    table.tHead.innerHTML = '<tr>' + playerCols.map(c => {
         const tooltip = statTooltips[c] ? ` title="${statTooltips[c]}"` : '';
         const sortIndicator = playerSortCol === c ? (playerSortAsc ? ' \u25B2' : ' \u25BC') : '';
         const activeClass = playerSortCol === c ? ' class="sort-active"' : '';
         return `<th onclick="sortPlayersTable('${c}')"${tooltip}${activeClass}>${c}${sortIndicator}</th>`;
-    }).join('') + '</tr></thead><tbody>';
-    data.forEach(row => {
-        html += '<tr>';
-        playerCols.forEach(col => {
-            let v = row[col];
-            if (v == null) v = '';
-            if (typeof v === 'number') {
-                v = formatStatValue(v, col);
-                html += `<td class="num">${v}</td>`;
-            } else if (col === 'Player') {
-                html += `<td><span class="player-link" onclick="showPlayerDetail('${(v||'').replace(/'/g, "\\'")}')">${v}</span></td>`;
-            } else if (col === 'Team') {
-                html += `<td>${getTeamCode(v)}</td>`;
-            } else {
-                html += `<td>${v}</td>`;
+    }).join('') + '</tr>';
+    if (!playersView) {
+        playersView = new VirtualTable(table.parentNode, table.tBodies[0], playerCols.length, 40, fillPlayerRow, 'No players');
+    }
+    playersView.setRows(filteredPlayers);
+}
+
+function fillPlayerRow(tr, row) {
+    playerCols.forEach((col, i) => {
+        const td = tr.cells[i];
+        let v = row[i];
+        if (v == null) v = '';
+        td.className = typeof v === 'number' ? 'num' : '';
+        if (col === 'Player') {
+            let link = td.firstElementChild;
+            if (!link) {
+                link = td.appendChild(document.createElement('span'));
+                link.className = 'player-link';
             }
-        });
-        html += '</tr>';
+            link.textContent = link.dataset.player = v;
+        } else if (typeof v === 'number') {
+            td.textContent = formatStatValue(v, col);
+        } else {
+            td.textContent = col === 'Team' ? getTeamCode(v) : v;
+        }
     });
-    table.innerHTML = html + '</tbody>';
 }
 
 function sortPlayersTable(col) {
@@ -414,12 +589,13 @@ function sortPlayersTable(col) {
     } else {
         playerSortCol = col;
         // Default: numbers sort descending (highest first), text sorts ascending (A-Z)
-        const isNumericCol = filteredPlayers.length > 0 && typeof filteredPlayers[0][col] === 'number';
+        const isNumericCol = filteredPlayers.length > 0 && typeof filteredPlayers[0][PC[col]] === 'number';
         playerSortAsc = !isNumericCol;
     }
 
+    const i = PC[col];
     filteredPlayers.sort((a, b) => {
-        let av = a[col], bv = b[col];
+        let av = a[i], bv = b[i];
         if (av == null) av = '';
         if (bv == null) bv = '';
 
@@ -436,23 +612,25 @@ function sortPlayersTable(col) {
 }
 
 function filterPlayersTable() {
-    const search = document.getElementById('players-search').value.toLowerCase();
-    const team = document.getElementById('players-team').value;
-    const minG = parseInt(document.getElementById('players-min-games').value) || 0;
-
-    filteredPlayers = (DATA.players || []).filter(p => {
-        if (search && !Object.values(p).some(v => String(v).toLowerCase().includes(search))) return false;
-        if (team && !String(p.Team || '').includes(team)) return false;
-        if (minG && (p.Games || 0) < minG) return false;
+    const search = $('players-search').value.toLowerCase();
+    const team = $('players-team').value;
+    const minG = parseInt($('players-min-games').value) || 0;
+
+    filteredPlayers = playerRows.filter(p => {
+        if (search && !p.some((v, i) => i < CSV_COL && String(v).toLowerCase().includes(search))) return false;
+        if (team && !String(p[PC.Team] || '').includes(team)) return false;
+        if (minG && (p[PC.Games] || 0) < minG) return false;
         return true;
     });
     renderPlayersTable();
 }
 
+const schedulePlayersFilter = rafThrottle(filterPlayersTable);
+
 function clearPlayersFilters() {
-    document.getElementById('players-search').value = '';
-    document.getElementById('players-team').value = '';
-    document.getElementById('players-min-games').value = '';
+    $('players-search').value = '';
+    $('players-team').value = '';
+    $('players-min-games').value = '';
     playerSortCol = null;
     playerSortAsc = false;
     filterPlayersTable();
@@ -460,8 +638,8 @@ function clearPlayersFilters() {
 
 function populateTeamDropdown() {
     const teams = new Set();
-    (DATA.players || []).forEach(p => { if (p.Team) p.Team.split(', ').forEach(t => teams.add(t)); });
-    const sel = document.getElementById('players-team');
+    playerRows.forEach(p => { const t = p[PC.Team]; if (t) t.split(', ').forEach(t => teams.add(t)); });
+    const sel = $('players-team');
     Array.from(teams).sort().forEach(t => {
         const o = document.createElement('option'); o.value = t; o.textContent = t; sel.appendChild(o);
     });
@@ -469,33 +647,27 @@ function populateTeamDropdown() {
 
 // Player Detail with Chart
 let playerChart = null;
-
-function showPlayerDetail(name) {
-    const games = (DATA.player_games || []).filter(g => g.player === name).sort((a,b) => (b.date_yyyymmdd||'').localeCompare(a.date_yyyymmdd||''));
-    const stats = (DATA.players || []).find(p => p.Player === name);
-
-    if (!stats && !games.length) { showToast('Player not found'); return; }
-
-    let html = `<h2>${name}</h2>`;
-    if (stats) {
-        html += `<p style="color:var(--text-secondary);margin-bottom:1rem;">${stats.Team || ''} | ${stats.Games || 0} games</p>
-        <div style="display:grid;grid-template-columns:repeat(4,1fr);gap:0.75rem;margin-bottom:1.5rem;">
-            <div class="player-stat-box"><div class="number">${(stats.PPG||0).toFixed(1)}</div><div class="label">PPG</div></div>
-            <div class="player-stat-box"><div class="number">${(stats.RPG||0).toFixed(1)}</div><div class="label">RPG</div></div>
-            <div class="player-stat-box"><div class="number">${(stats.APG||0).toFixed(1)}</div><div class="label">APG</div></div>
-            <div class="player-stat-box"><div class="number">${(stats.MPG||0).toFixed(1)}</div><div class="label">MPG</div></div>
+let playerModal = null;  // built on first open by buildPlayerModalSkeleton
+let playerModalGames = [];
+
+const PLAYER_STAT_BOXES = ['PPG', 'RPG', 'APG', 'MPG'];
+const PLAYER_PCT_STATS = ['FG%', '3P%', 'FT%'];
+
+// Parse the modal body once and keep references to every node a player fills
+// in (data-ref); each open then only rewrites text and toggles sections
+function buildPlayerModalSkeleton() {
+    const root = $('player-detail');
+    root.innerHTML = `<h2 data-ref="name"></h2>
+        <div data-ref="stats">
+            <p style="color:var(--text-secondary);margin-bottom:1rem;" data-ref="meta"></p>
+            <div style="display:grid;grid-template-columns:repeat(4,1fr);gap:0.75rem;margin-bottom:1.5rem;">
+                ${PLAYER_STAT_BOXES.map(s => `<div class="player-stat-box"><div class="number" data-ref="${s}"></div><div class="label">${s}</div></div>`).join('')}
+            </div>
+            <div style="display:grid;grid-template-columns:repeat(3,1fr);gap:0.75rem;margin-bottom:1.5rem;">
+                ${PLAYER_PCT_STATS.map(s => `<div style="text-align:center;"><strong data-ref="${s}"></strong><br><small>${s}</small></div>`).join('')}
+            </div>
         </div>
-        <div style="display:grid;grid-template-columns:repeat(3,1fr);gap:0.75rem;margin-bottom:1.5rem;">
-            <div style="text-align:center;"><strong>${((stats['FG%']||0)*100).toFixed(1)}%</strong><br><small>FG%</small></div>
-            <div style="text-align:center;"><strong>${((stats['3P%']||0)*100).toFixed(1)}%</strong><br><small>3P%</small></div>
-            <div style="text-align:center;"><strong>${((stats['FT%']||0)*100).toFixed(1)}%</strong><br><small>FT%</small></div>
-        </div>`;
-    }
-
-    // Add chart section if multiple games
-    if (games.length > 1) {
-        html += `
-        <div class="chart-section">
+        <div class="chart-section" data-ref="chart">
             <div class="chart-header">
                 <h4>Performance Trend</h4>
                 <div class="chart-toggles">
@@ -508,33 +680,62 @@ function showPlayerDetail(name) {
             <div class="chart-container">
                 <canvas id="player-chart"></canvas>
             </div>
+        </div>
+        <div data-ref="log">
+            <h4 style="margin-top:1.5rem;margin-bottom:0.5rem;">Game Log</h4><div class="table-container" style="max-height:250px;"><table><thead><tr><th>Date</th><th>Opp</th><th>MIN</th><th>PTS</th><th>REB</th><th>AST</th><th>STL</th><th>BLK</th><th>FG</th><th>+/-</th></tr></thead><tbody id="player-game-log"></tbody></table></div>
         </div>`;
-    }
 
-    if (games.length) {
-        html += '<h4 style="margin-top:1.5rem;margin-bottom:0.5rem;">Game Log</h4><div class="table-container" style="max-height:250px;"><table><thead><tr><th>Date</th><th>Opp</th><th>MIN</th><th>PTS</th><th>REB</th><th>AST</th><th>STL</th><th>BLK</th><th>FG</th><th>+/-</th></tr></thead><tbody>';
-        games.forEach(g => html += `<tr><td>${g.date||''}</td><td>${g.opponent||''}</td><td>${formatMinutes(g.mp)}</td><td>${g.pts||0}</td><td>${g.trb||0}</td><td>${g.ast||0}</td><td>${g.stl||0}</td><td>${g.blk||0}</td><td>${g.fg||0}-${g.fga||0}</td><td>${g.plus_minus||0}</td></tr>`);
-        html += '</tbody></table></div>';
+    const statRefs = {};
+    root.querySelectorAll('[data-ref]').forEach(el => { statRefs[el.dataset.ref] = el; });
+    const toggles = root.querySelectorAll('.chart-toggle');
+    toggles.forEach(btn => btn.addEventListener('click', () => {
+        toggles.forEach(b => b.classList.toggle('active', b === btn));
+        initPlayerChart(playerModalGames, btn.dataset.stat);
+    }));
+    const tbody = document.getElementById('player-game-log');
+    const gameLog = new VirtualTable(tbody.closest('.table-container'), tbody, 10, 28, fillGameLogRow);
+    return { statRefs, toggles, gameLog };
+}
+
+function showPlayerDetail(name) {
+    const games = (DATA.player_games || []).filter(g => g.player === name).sort((a,b) => (b.date_yyyymmdd||'').localeCompare(a.date_yyyymmdd||''));
+    const row = playerRows.find(p => p[PC.Player] === name);
+
+    if (!row && !games.length) { showToast('Player not found'); return; }
+
+    if (!playerModal) playerModal = buildPlayerModalSkeleton();
+    const { statRefs, toggles, gameLog } = playerModal;
+    statRefs.name.textContent = name;
+    statRefs.stats.hidden = !row;
+    if (row) {
+        statRefs.meta.textContent = `${row[PC.Team] || ''} | ${row[PC.Games] || 0} games`;
+        PLAYER_STAT_BOXES.forEach(s => { statRefs[s].textContent = fmt1(row[PC[s]] || 0); });
+        PLAYER_PCT_STATS.forEach(s => { statRefs[s].textContent = fmtPct(row[PC[s]] || 0); });
     }
+    // Chart only when there are multiple games
+    statRefs.chart.hidden = games.length <= 1;
+    if (playerChart) { playerChart.destroy(); playerChart = null; }
+    statRefs.log.hidden = !games.length;
+    playerModalGames = games;
 
-    document.getElementById('player-detail').innerHTML = html;
     openModal('player-modal');
+    gameLog.setRows(games);
 
     // Initialize chart after DOM update
     if (games.length > 1) {
+        toggles.forEach(b => b.classList.toggle('active', b.dataset.stat === 'pts'));
         setTimeout(() => initPlayerChart(games, 'pts'), 100);
-
-        // Add toggle listeners
-        document.querySelectorAll('.chart-toggle').forEach(btn => {
-            btn.addEventListener('click', (e) => {
-                document.querySelectorAll('.chart-toggle').forEach(b => b.classList.remove('active'));
-                e.target.classList.add('active');
-                initPlayerChart(games, e.target.dataset.stat);
-            });
-        });
     }
 }
 
+function fillGameLogRow(tr, g) {
+    const values = [
+        g.date || '', g.opponent || '', formatMinutes(g.mp), g.pts || 0, g.trb || 0, g.ast || 0,
+        g.stl || 0, g.blk || 0, `${g.fg || 0}-${g.fga || 0}`, g.plus_minus || 0,
+    ];
+    for (let i = 0; i < values.length; i++) tr.cells[i].textContent = values[i];
+}
+
 function initPlayerChart(games, stat) {
     const ctx = document.getElementById('player-chart');
     if (!ctx) return;
@@ -624,46 +825,67 @@ function initPlayerChart(games, stat) {
 
 // Venues
 function renderVenuesTable() {
-    const venues = DATA.venues || [];
-    const visited = venues.filter(v => v.visited).length;
-    document.getElementById('arena-progress-fill').style.width = `${(visited/30)*100}%`;
-    document.getElementById('arena-progress-text').textContent = `${visited}/30 Arenas Visited`;
+    const visited = DATA.venues_visited.length;
+    $('arena-progress-fill').style.width = `${(visited/30)*100}%`;
+    $('arena-progress-text').textContent = `${visited}/30 Arenas Visited`;
     filterVenuesTable();
 }
 
 function filterVenuesTable() {
-    const filter = document.getElementById('venues-filter').value;
-    let venues = DATA.venues || [];
-    if (filter === 'visited') venues = venues.filter(v => v.visited);
-    else if (filter === 'unvisited') venues = venues.filter(v => !v.visited);
-
-    const tbody = document.querySelector('#venues-table tbody');
-    tbody.innerHTML = venues.map(v => `
-        <tr>
-            <td>${v.team}</td>
-            <td>${v.name}</td>
-            <td>${v.city}</td>
-            <td>${v.state}</td>
-            <td class="num">${v.games}</td>
-            <td>${v.first_visit || '-'}</td>
-            <td class="${v.visited ? 'status-visited' : 'status-not-visited'}">${v.visited ? '✓ Visited' : 'Not Yet'}</td>
-        </tr>
-    `).join('');
+    const filter = $('venues-filter').value;
+    const venues = filter === 'visited' ? DATA.venues_visited
+        : filter === 'unvisited' ? DATA.venues_unvisited : DATA.venues || [];
+    replaceRows($('venues-table').tBodies[0], venues, cachedVenueRow);
+}
+
+const scheduleVenuesFilter = rafThrottle(filterVenuesTable);
+
+// Each venue's row is built once; the filter views only choose which of
+// these nodes are in the tbody (DATA never changes after load)
+const venueRowCache = new Map();
+
+function cachedVenueRow(v) {
+    let tr = venueRowCache.get(v);
+    if (!tr) venueRowCache.set(v, tr = venueRow(v));
+    return tr;
+}
+
+function venueRow(v) {
+    return textRow([
+        v.team, v.name, v.city, v.state, [v.games, 'num'], v.first_visit || '-',
+        v.visited ? ['✓ Visited', 'status-visited'] : ['Not Yet', 'status-not-visited'],
+    ]);
 }
 
 // Map
 function initMap() {
-    arenaMap = L.map('arena-map').setView([39.8, -98.5], 4);
+    if (arenaMap) return;
+    // All markers draw onto one shared <canvas> instead of an SVG node each;
+    // popup markup is prebuilt by the generator (_popup)
+    const renderer = L.canvas();
+    arenaMap = L.map('arena-map', { preferCanvas: true, renderer }).setView([39.8, -98.5], 4);
     L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', { attribution: '© OpenStreetMap' }).addTo(arenaMap);
-    (DATA.venues || []).forEach(v => {
-        const color = v.visited ? '#27ae60' : '#95a5a6';
-        L.circleMarker([v.lat, v.lng], { radius: 10, fillColor: color, color: '#fff', weight: 2, fillOpacity: 0.9 })
+    const venues = DATA.venues || [];
+    const lat = b64Array(DATA.venue_lat, Float32Array);
+    const lng = b64Array(DATA.venue_lng, Float32Array);
+    for (let i = 0; i < venues.length; i++) {
+        const color = venues[i].visited ? '#27ae60' : '#95a5a6';
+        L.circleMarker([lat[i], lng[i]], { renderer, radius: 10, fillColor: color, color: '#fff', weight: 2, fillOpacity: 0.9 })
             .addTo(arenaMap)
-            .bindPopup(`<strong>${v.team}</strong><br>${v.name}<br>${v.city}, ${v.state}<br><em>${v.visited ? v.games + ' games' : 'Not visited'}</em>`);
-    });
+            .bindPopup(venues[i]._popup);
+    }
+}
+
+// Build the map only once its container is actually on screen (it has a real
+// size by then, and tile requests are skipped entirely if it is never shown)
+function observeMapSection() {
+    if (!window.IntersectionObserver) return;  // showSection() falls back to a direct init
+    new IntersectionObserver((entries, observer) => {
+        if (entries[0].isIntersecting) { initMap(); observer.disconnect(); }
+    }).observe($('arena-map'));
 }
 
-// Constants are auto-generated at the start of this script
+// Team constants are prepended by the generator (_generate_js_constants)
 
 // Team Checklist
 let currentChecklistView = 'all';
@@ -676,15 +898,15 @@ function renderTeamChecklist() {
     const summary = checklist.summary || { teamsSeen: 0, totalTeams: 30 };
 
     // Update progress bar
-    document.getElementById('team-progress-fill').style.width = `${(summary.teamsSeen/30)*100}%`;
-    document.getElementById('team-progress-text').textContent = `${summary.teamsSeen}/30 Teams Seen`;
+    $('team-progress-fill').style.width = `${(summary.teamsSeen/30)*100}%`;
+    $('team-progress-text').textContent = `${summary.teamsSeen}/30 Teams Seen`;
 
     showChecklistView(currentChecklistView);
 }
 
 function showChecklistView(view) {
     currentChecklistView = view;
-    const container = document.getElementById('team-checklist-container');
+    const container = $('team-checklist-container');
     const checklist = DATA.teamChecklist || {};
     const teams = checklist.teams || [];
     const divisions = checklist.divisions || {};
@@ -786,142 +1008,122 @@ function showChecklistView(view) {
     container.innerHTML = html;
 }
 
-// MILESTONE_CATEGORIES is auto-generated from Python constants
-
-// Master order for displaying all milestones (grouped by category)
-const MILESTONE_ORDER = [
-    // Multi-stat achievements
-    'quadruple_doubles', 'triple_doubles', 'near_triple_doubles', 'double_doubles', 'near_double_doubles',
-    'five_by_fives', 'all_around_games',
-    // Scoring (high to low)
-    'seventy_point_games', 'sixty_point_games', 'fifty_point_games', 'forty_five_point_games',
-    'forty_point_games', 'thirty_five_point_games', 'thirty_point_games', 'twenty_five_point_games', 'twenty_point_games',
-    // Combined stats
-    'twenty_twenty_games', 'thirty_ten_games', 'twenty_five_ten_games', 'twenty_ten_five_games',
-    'twenty_ten_games', 'points_assists_double_double',
-    // Rebounding (high to low)
-    'twenty_five_rebound_games', 'twenty_rebound_games', 'eighteen_rebound_games',
-    'fifteen_rebound_games', 'twelve_rebound_games', 'ten_rebound_games',
-    // Assists (high to low)
-    'twenty_assist_games', 'fifteen_assist_games', 'twelve_assist_games', 'ten_assist_games',
-    // Three-pointers
-    'ten_three_games', 'eight_three_games', 'seven_three_games', 'six_three_games', 'five_three_games', 'perfect_from_three',
-    // Steals (high to low)
-    'ten_steal_games', 'seven_steal_games', 'five_steal_games', 'four_steal_games',
-    // Blocks (high to low)
-    'ten_block_games', 'seven_block_games', 'five_block_games', 'four_block_games',
-    // Efficiency
-    'high_game_score', 'efficient_scoring_games', 'hot_shooting_games', 'perfect_fg_games', 'perfect_ft_games',
-    // Defensive
-    'defensive_monster_games', 'zero_turnover_games',
-    // Plus/Minus
-    'plus_25_games', 'plus_20_games', 'minus_25_games'
+// Filter dropdown options as [value, label] pairs (populated at init)
+const MILESTONE_CATS = [
+    ['all', 'All Categories'], ['multi', 'Multi-Category'], ['scoring', 'Scoring'],
+    ['rebounding', 'Rebounding'], ['assists', 'Assists'], ['steals', 'Steals'],
+    ['blocks', 'Blocks'], ['threes', 'Three-Pointers'], ['efficiency', 'Efficiency'],
+    ['combined', 'Combined'], ['defensive', 'Defensive'], ['plusminus', 'Plus/Minus']
 ];
+const CAREER_FIRST_CATS = [['all', 'All'], ['first', 'Career Firsts'], ['milestone', 'Career Milestones']];
+
+function populateSelect(id, options) {
+    const sel = $(id);
+    options.forEach(([value, label]) => sel.add(new Option(label, value)));
+}
 
 function renderMilestones() {
     filterMilestones();
 }
 
 function filterMilestones() {
-    const category = document.getElementById('milestone-category').value;
-    const search = document.getElementById('milestone-search').value.toLowerCase();
-    const container = document.getElementById('milestones-container');
+    const category = $('milestone-category').value;
+    const search = $('milestone-search').value.toLowerCase();
+    const container = $('milestones-container');
+    // The unfiltered view is prerendered by the generator
+    if (category === 'all' && !search && DATA.milestonesHtml) {
+        container.innerHTML = DATA.milestonesHtml;
+        return;
+    }
     const milestones = DATA.milestones || {};
     const descriptions = DATA.milestone_descriptions || {};
 
-    let keysToShow = [];
-    if (category === 'all') {
-        // Use master order for "all" view to group related stats together
-        keysToShow = MILESTONE_ORDER.filter(k => milestones[k] && milestones[k].length > 0);
-        // Also include any milestones not in the master order
-        Object.keys(milestones).forEach(k => {
-            if (!keysToShow.includes(k) && milestones[k] && milestones[k].length > 0) {
-                keysToShow.push(k);
-            }
-        });
-    } else {
-        keysToShow = (MILESTONE_CATEGORIES[category] || []).filter(k => milestones[k] && milestones[k].length > 0);
-    }
+    // Non-empty keys per category, in display order (precomputed in Python)
+    const keysToShow = (DATA.milestonesByCategory || {})[category] || [];
 
-    let html = '';
+    const parts = [];
     keysToShow.forEach(key => {
+        // Lists arrive sorted by date descending with a lowercase search key (_k)
         let data = milestones[key] || [];
 
-        // Sort by date descending (most recent first)
-        data = [...data].sort((a, b) => (b.date_yyyymmdd || '').localeCompare(a.date_yyyymmdd || ''));
-
         // Filter by search
         if (search) {
-            data = data.filter(m => m.player?.toLowerCase().includes(search) || m.team?.toLowerCase().includes(search));
+            data = data.filter(m => m._k.includes(search));
         }
 
         if (data.length === 0 && search) return;
 
         const title = descriptions[key] || key.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase());
-        html += `<div class="milestone-card">
-            <h4>${title} <span class="count">${data.length}</span></h4>`;
+        parts.push(`<div class="milestone-card">
+            <h4>${escapeHtml(title)} <span class="count">${data.length}</span></h4>`);
 
         if (data.length === 0) {
-            html += '<p class="empty">None recorded</p>';
+            parts.push(EMPTY.milestoneCard);
         } else {
-            html += '<div class="table-container" style="max-height:300px;"><table><thead><tr><th>Date</th><th>Player</th><th>Team</th><th>vs</th><th>Detail</th></tr></thead><tbody>';
+            parts.push('<div class="table-container" style="max-height:300px;"><table><thead><tr><th>Date</th><th>Player</th><th>Team</th><th>vs</th><th>Detail</th></tr></thead><tbody>');
             data.slice(0, 50).forEach(m => {
-                html += `<tr>
-                    <td>${m.date || ''}</td>
-                    <td><span class="player-link" onclick="showPlayerDetail('${(m.player||'').replace(/'/g, "\\'")}')">${m.player || ''}</span></td>
-                    <td>${m.team || ''}</td>
-                    <td>${m.opponent || ''}</td>
-                    <td>${m.detail || ''}</td>
-                </tr>`;
+                parts.push(`<tr>
+                    <td>${escapeHtml(m.date || '')}</td>
+                    <td><span class="player-link" data-player="${escapeHtml(m.player || '')}">${escapeHtml(m.player || '')}</span></td>
+                    <td>${escapeHtml(m.team || '')}</td>
+                    <td>${escapeHtml(m.opponent || '')}</td>
+                    <td>${escapeHtml(m.detail || '')}</td>
+                </tr>`);
             });
-            if (data.length > 50) html += `<tr><td colspan="5" style="text-align:center;color:var(--text-muted);">...and ${data.length - 50} more</td></tr>`;
-            html += '</tbody></table></div>';
+            if (data.length > 50) parts.push(`<tr><td colspan="5" style="text-align:center;color:var(--text-muted);">...and ${data.length - 50} more</td></tr>`);
+            parts.push('</tbody></table></div>');
         }
-        html += '</div>';
+        parts.push('</div>');
     });
 
-    if (!html) {
-        html = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No milestones found</p>';
-    }
-
-    container.innerHTML = html;
+    container.innerHTML = parts.length
+        ? parts.join('')
+        : EMPTY.milestones;
 }
 
 // CSV Download
 function downloadCSV(type) {
     const data = type === 'players' ? filteredPlayers : null;
     if (!data || !data.length) { showToast('No data'); return; }
-    const headers = playerCols;
-    const csv = [headers.join(','), ...data.map(r => headers.map(h => {
-        let v = r[h]; if (v == null) v = '';
-        if (typeof v === 'string' && (v.includes(',') || v.includes('"'))) v = '"' + v.replace(/"/g, '""') + '"';
-        return v;
-    }).join(','))].join('\n');
-    const blob = new Blob([csv], {type:'text/csv'});
+    const blob = new Blob([encodeLines([playerCols.join(','), ...data.map(r => r[CSV_COL])])], {type:'text/csv'});
     const a = document.createElement('a'); a.href = URL.createObjectURL(blob);
     a.download = 'nba_players.csv'; a.click();
     showToast('Download started');
 }
 
+// UTF-8 encode newline-separated lines straight into one buffer, without
+// building the joined string first. encodeInto needs at most 3 bytes per
+// UTF-16 unit, so the buffer is sized for that and trimmed afterwards.
+function encodeLines(lines) {
+    const encoder = new TextEncoder();
+    const out = new Uint8Array(lines.reduce((n, line) => n + line.length * 3 + 1, 0));
+    let offset = 0;
+    lines.forEach((line, i) => {
+        if (i) out[offset++] = 10;
+        offset += encoder.encodeInto(line, out.subarray(offset)).written;
+    });
+    return out.subarray(0, offset);
+}
+
 // Stat Leaders
 function renderLeaders() {
-    const players = DATA.players || [];
-    const grid = document.getElementById('leaders-grid');
+    const players = playerRows;
+    const grid = $('leaders-grid');
 
     if (!players.length) {
-        grid.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No player data</p>';
+        grid.innerHTML = EMPTY.playerData;
         return;
     }
 
     const categories = [
-        { key: 'PPG', label: 'Points Per Game', format: v => v.toFixed(1) },
-        { key: 'RPG', label: 'Rebounds Per Game', format: v => v.toFixed(1) },
-        { key: 'APG', label: 'Assists Per Game', format: v => v.toFixed(1) },
-        { key: 'SPG', label: 'Steals Per Game', format: v => v.toFixed(1) },
-        { key: 'BPG', label: 'Blocks Per Game', format: v => v.toFixed(1) },
-        { key: 'FG%', label: 'Field Goal %', format: v => (v * 100).toFixed(1) + '%' },
-        { key: '3P%', label: 'Three-Point %', format: v => (v * 100).toFixed(1) + '%' },
-        { key: 'FT%', label: 'Free Throw %', format: v => (v * 100).toFixed(1) + '%' },
+        { key: 'PPG', label: 'Points Per Game', format: fmt1 },
+        { key: 'RPG', label: 'Rebounds Per Game', format: fmt1 },
+        { key: 'APG', label: 'Assists Per Game', format: fmt1 },
+        { key: 'SPG', label: 'Steals Per Game', format: fmt1 },
+        { key: 'BPG', label: 'Blocks Per Game', format: fmt1 },
+        { key: 'FG%', label: 'Field Goal %', format: fmtPct },
+        { key: '3P%', label: 'Three-Point %', format: fmtPct },
+        { key: 'FT%', label: 'Free Throw %', format: fmtPct },
         { key: 'Total PTS', label: 'Total Points', format: v => v.toLocaleString() },
         { key: 'Total REB', label: 'Total Rebounds', format: v => v.toLocaleString() },
         { key: 'Total AST', label: 'Total Assists', format: v => v.toLocaleString() },
@@ -930,9 +1132,10 @@ function renderLeaders() {
 
     grid.innerHTML = categories.map(cat => {
         // Sort players by this stat and take top 5
+        const k = PC[cat.key];
         const sorted = [...players]
-            .filter(p => p[cat.key] != null && p.Games >= 2)
-            .sort((a, b) => b[cat.key] - a[cat.key])
+            .filter(p => p[k] != null && p[PC.Games] >= 2)
+            .sort((a, b) => b[k] - a[k])
             .slice(0, 5);
 
         return `
@@ -942,9 +1145,9 @@ function renderLeaders() {
                 ${sorted.map((p, i) => `
                     <li class="leader-item">
                         <span class="leader-rank">${i + 1}</span>
-                        <span class="leader-name" onclick="showPlayerDetail('${(p.Player||'').replace(/'/g, "\\'")}')">${p.Player}</span>
-                        <span class="leader-team">${getTeamCode(p.Team)}</span>
-                        <span class="leader-value">${cat.format(p[cat.key])}</span>
+                        <span class="leader-name" data-player="${escapeHtml(p[PC.Player])}">${p[PC.Player]}</span>
+                        <span class="leader-team">${getTeamCode(p[PC.Team])}</span>
+                        <span class="leader-value">${cat.format(p[k])}</span>
                     </li>
                 `).join('')}
             </ul>
@@ -954,12 +1157,12 @@ function renderLeaders() {
 
 // Career Firsts
 function renderCareerFirsts(filter = 'all', search = '') {
-    const container = document.getElementById('career-firsts-container');
+    const container = $('career-firsts-container');
     if (!container) return;
 
     const firsts = DATA.careerFirsts || [];
     if (!firsts.length) {
-        container.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No career firsts found. Run the career firsts scraper to populate this data.</p>';
+        container.innerHTML = EMPTY.careerFirstsMissing;
         return;
     }
 
@@ -970,14 +1173,11 @@ function renderCareerFirsts(filter = 'all', search = '') {
     }
     if (search) {
         const searchLower = search.toLowerCase();
-        filtered = filtered.filter(f =>
-            (f.player_name || '').toLowerCase().includes(searchLower) ||
-            (f.milestone || '').toLowerCase().includes(searchLower)
-        );
+        filtered = filtered.filter(f => f._k.includes(searchLower));
     }
 
     if (!filtered.length) {
-        container.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No matching career firsts found.</p>';
+        container.innerHTML = EMPTY.careerFirstsFiltered;
         return;
     }
 
@@ -1025,7 +1225,7 @@ function renderCareerFirsts(filter = 'all', search = '') {
             </div>`;
     }
 
-    container.innerHTML = html || '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No career firsts found.</p>';
+    container.innerHTML = html || EMPTY.careerFirsts;
 }
 
 function formatCareerFirstDate(dateStr) {
@@ -1045,8 +1245,8 @@ function formatCareerFirstDate(dateStr) {
 }
 
 function filterCareerFirsts() {
-    const category = document.getElementById('career-firsts-category')?.value || 'all';
-    const search = document.getElementById('career-firsts-search')?.value || '';
+    const category = $('career-firsts-category')?.value || 'all';
+    const search = $('career-firsts-search')?.value || '';
     renderCareerFirsts(category, search);
 }
 
@@ -1055,7 +1255,7 @@ function showRecordsSubTab(tabId) {
     document.querySelectorAll('#records .sub-tab').forEach(t => t.classList.remove('active'));
     document.querySelectorAll('#records .sub-section').forEach(s => s.classList.remove('active'));
     document.querySelector(`#records .sub-tab[onclick*="${tabId}"]`).classList.add('active');
-    document.getElementById(tabId).classList.add('active');
+    $(tabId).classList.add('active');
     updateURL('records', { sub: tabId });
 }
 
@@ -1063,15 +1263,15 @@ function showMatchupsSubTab(tabId) {
     document.querySelectorAll('#matchups .sub-tab').forEach(t => t.classList.remove('active'));
     document.querySelectorAll('#matchups .sub-section').forEach(s => s.classList.remove('active'));
     document.querySelector(`#matchups .sub-tab[onclick*="${tabId}"]`).classList.add('active');
-    document.getElementById(tabId).classList.add('active');
+    $(tabId).classList.add('active');
     updateURL('matchups', { sub: tabId });
 }
 
 // Records
 function renderRecords() {
     const games = DATA.games || [];
-    const grid = document.getElementById('game-records-grid');
-    if (!games.length) { grid.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No games found</p>'; return; }
+    const grid = $('game-records-grid');
+    if (!games.length) { grid.innerHTML = EMPTY.games; return; }
 
     // Calculate records
     const withMargin = games.map(g => ({
@@ -1086,17 +1286,17 @@ function renderRecords() {
 
     const categories = [
         { title: 'Biggest Blowouts', data: [...withMargin].sort((a,b) => b.margin - a.margin).slice(0,10),
-          render: g => `<td class="rank">${g._rank}</td><td class="game-link" onclick="showBoxScore('${g.game_id}')">${g.date}</td><td>${getTeamCode(g.winner)} ${g.winScore}, ${getTeamCode(g.loser)} ${g.loseScore}</td><td class="num">${g.margin}</td>` },
+          render: g => `<td class="rank">${g._rank}</td><td class="game-link" data-game="${g.game_id}">${g.date}</td><td>${getTeamCode(g.winner)} ${g.winScore}, ${getTeamCode(g.loser)} ${g.loseScore}</td><td class="num">${g.margin}</td>` },
         { title: 'Closest Games', data: [...withMargin].sort((a,b) => a.margin - b.margin).slice(0,10),
-          render: g => `<td class="rank">${g._rank}</td><td class="game-link" onclick="showBoxScore('${g.game_id}')">${g.date}</td><td>${getTeamCode(g.winner)} ${g.winScore}, ${getTeamCode(g.loser)} ${g.loseScore}</td><td class="num">${g.margin}</td>` },
+          render: g => `<td class="rank">${g._rank}</td><td class="game-link" data-game="${g.game_id}">${g.date}</td><td>${getTeamCode(g.winner)} ${g.winScore}, ${getTeamCode(g.loser)} ${g.loseScore}</td><td class="num">${g.margin}</td>` },
         { title: 'Highest Scoring', data: [...withMargin].sort((a,b) => b.combined - a.combined).slice(0,10),
-          render: g => `<td class="rank">${g._rank}</td><td class="game-link" onclick="showBoxScore('${g.game_id}')">${g.date}</td><td>${getTeamCode(g.away_team)} ${g.away_score} @ ${getTeamCode(g.home_team)} ${g.home_score}</td><td class="num">${g.combined}</td>` },
+          render: g => `<td class="rank">${g._rank}</td><td class="game-link" data-game="${g.game_id}">${g.date}</td><td>${getTeamCode(g.away_team)} ${g.away_score} @ ${getTeamCode(g.home_team)} ${g.home_score}</td><td class="num">${g.combined}</td>` },
         { title: 'Lowest Scoring', data: [...withMargin].sort((a,b) => a.combined - b.combined).slice(0,10),
-          render: g => `<td class="rank">${g._rank}</td><td class="game-link" onclick="showBoxScore('${g.game_id}')">${g.date}</td><td>${getTeamCode(g.away_team)} ${g.away_score} @ ${getTeamCode(g.home_team)} ${g.home_score}</td><td class="num">${g.combined}</td>` },
+          render: g => `<td class="rank">${g._rank}</td><td class="game-link" data-game="${g.game_id}">${g.date}</td><td>${getTeamCode(g.away_team)} ${g.away_score} @ ${getTeamCode(g.home_team)} ${g.home_score}</td><td class="num">${g.combined}</td>` },
         { title: 'Most Points (Single Team)', data: [...withMargin].sort((a,b) => b.winScore - a.winScore).slice(0,10),
-          render: g => `<td class="rank">${g._rank}</td><td class="game-link" onclick="showBoxScore('${g.game_id}')">${g.date}</td><td>${getTeamCode(g.winner)} vs ${getTeamCode(g.loser)}</td><td class="num">${g.winScore}</td>` },
+          render: g => `<td class="rank">${g._rank}</td><td class="game-link" data-game="${g.game_id}">${g.date}</td><td>${getTeamCode(g.winner)} vs ${getTeamCode(g.loser)}</td><td class="num">${g.winScore}</td>` },
         { title: 'Fewest Points (Single Team)', data: [...withMargin].sort((a,b) => a.loseScore - b.loseScore).slice(0,10),
-          render: g => `<td class="rank">${g._rank}</td><td class="game-link" onclick="showBoxScore('${g.game_id}')">${g.date}</td><td>${getTeamCode(g.loser)} vs ${getTeamCode(g.winner)}</td><td class="num">${g.loseScore}</td>` },
+          render: g => `<td class="rank">${g._rank}</td><td class="game-link" data-game="${g.game_id}">${g.date}</td><td>${getTeamCode(g.loser)} vs ${getTeamCode(g.winner)}</td><td class="num">${g.loseScore}</td>` },
     ];
 
     grid.innerHTML = categories.map(cat => {
@@ -1107,15 +1307,15 @@ function renderRecords() {
     // Show PBP records tab if any game has PBP data
     const hasPbp = games.some(g => g.espnPbpAnalysis);
     if (hasPbp) {
-        document.getElementById('pbp-records-tab').style.display = '';
+        $('pbp-records-tab').style.display = '';
         renderPbpRecords();
     }
 }
 
 function renderPlayerRecords() {
     const playerGames = DATA.player_games || [];
-    const grid = document.getElementById('player-records-grid');
-    if (!playerGames.length) { grid.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No player data</p>'; return; }
+    const grid = $('player-records-grid');
+    if (!playerGames.length) { grid.innerHTML = EMPTY.playerData; return; }
 
     const statCats = [
         { key: 'pts', title: 'Most Points', label: 'PTS' },
@@ -1138,7 +1338,7 @@ function renderPlayerRecords() {
             }
             return `<tr>
             <td class="rank">${i+1}</td>
-            <td><span class="player-link" onclick="showPlayerDetail('${(p.player||'').replace(/'/g, "\\'")}')">${p.player}</span></td>
+            <td><span class="player-link" data-player="${escapeHtml(p.player)}">${p.player}</span></td>
             <td>${shortDate}</td>
             <td>${getTeamCode(p.team || '')}</td>
             <td class="num">${p[cat.key]}</td>
@@ -1150,9 +1350,9 @@ function renderPlayerRecords() {
 
 function renderPbpRecords() {
     const games = DATA.games || [];
-    const grid = document.getElementById('pbp-records-grid');
+    const grid = $('pbp-records-grid');
     const pbpGames = games.filter(g => g.espnPbpAnalysis);
-    if (!pbpGames.length) { grid.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No PBP data available</p>'; return; }
+    if (!pbpGames.length) { grid.innerHTML = EMPTY.pbpData; return; }
 
     // Biggest Comebacks
     const comebacks = pbpGames
@@ -1189,7 +1389,7 @@ function renderPbpRecords() {
     if (comebacks.length) {
         const rows = comebacks.map((g, i) => `<tr>
             <td class="rank">${i+1}</td>
-            <td class="game-link" onclick="showBoxScore('${g.game_id}')">${g.date}</td>
+            <td class="game-link" data-game="${g.game_id}">${g.date}</td>
             <td>${g.comeback.team}</td>
             <td class="num">${g.comeback.deficit} pts</td>
         </tr>`).join('');
@@ -1199,7 +1399,7 @@ function renderPbpRecords() {
     if (runs.length) {
         const rows = runs.slice(0, 10).map((r, i) => `<tr>
             <td class="rank">${i+1}</td>
-            <td class="game-link" onclick="showBoxScore('${r.game.game_id}')">${r.game.date}</td>
+            <td class="game-link" data-game="${r.game.game_id}">${r.game.date}</td>
             <td>${r.team}</td>
             <td class="num">${r.points}-0 run</td>
         </tr>`).join('');
@@ -1209,7 +1409,7 @@ function renderPbpRecords() {
     if (streaks.length) {
         const rows = streaks.slice(0, 10).map((s, i) => `<tr>
             <td class="rank">${i+1}</td>
-            <td class="game-link" onclick="showBoxScore('${s.game.game_id}')">${s.game.date}</td>
+            <td class="game-link" data-game="${s.game.game_id}">${s.game.date}</td>
             <td>${s.player} (${s.team})</td>
             <td class="num">${s.points} pts</td>
         </tr>`).join('');
@@ -1225,21 +1425,21 @@ function renderPbpRecords() {
         }).slice(0, 10);
         const rows = sorted.map((g, i) => `<tr>
             <td class="rank">${i+1}</td>
-            <td class="game-link" onclick="showBoxScore('${g.game_id}')">${g.date}</td>
+            <td class="game-link" data-game="${g.game_id}">${g.date}</td>
             <td>${g.shot.player} (${g.shot.team})</td>
             <td class="num">Q${g.shot.period} ${g.shot.time}</td>
         </tr>`).join('');
         html += `<div class="record-item pbp-record"><h4>Decisive Shots</h4><table>${rows}</table></div>`;
     }
 
-    grid.innerHTML = html || '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No PBP records available</p>';
+    grid.innerHTML = html || EMPTY.pbpRecords;
 }
 
 // Scorigami
 function renderScorigami() {
     const games = DATA.games || [];
-    const statsDiv = document.getElementById('scorigami-stats');
-    const gridEl = document.getElementById('scorigami-grid');
+    const statsDiv = $('scorigami-stats');
+    const gridEl = $('scorigami-grid');
     if (!games.length) { gridEl.innerHTML = '<tr><td>No games</td></tr>'; return; }
 
     // Build score map: winScore-loseScore -> [games]
@@ -1277,32 +1477,32 @@ function renderScorigami() {
     maxLose = Math.ceil(maxLose / 5) * 5;
 
     // Build grid: rows = winner score, cols = loser score
-    let html = '<thead><tr><th></th>';
+    const parts = ['<thead><tr><th></th>'];
     for (let l = minLose; l <= maxLose; l++) {
-        html += `<th>${l}</th>`;
+        parts.push(`<th>${l}</th>`);
     }
-    html += '</tr></thead><tbody>';
+    parts.push('</tr></thead><tbody>');
 
     for (let w = minWin; w <= maxWin; w++) {
-        html += `<tr><td class="row-header">${w}</td>`;
+        parts.push(`<tr><td class="row-header">${w}</td>`);
         for (let l = minLose; l <= maxLose; l++) {
             if (l >= w) {
-                html += '<td></td>';
+                parts.push('<td></td>');
                 continue;
             }
             const key = `${w}-${l}`;
             const count = scoreMap[key] ? scoreMap[key].length : 0;
             if (count === 0) {
-                html += '<td></td>';
+                parts.push('<td></td>');
             } else {
                 const freq = count >= 5 ? 5 : count >= 4 ? 4 : count >= 3 ? 3 : count >= 2 ? 2 : 1;
-                html += `<td class="has-score freq-${freq}" data-key="${key}" onmouseenter="showScorigamiTooltip(event,'${key}')" onmouseleave="hideScorigamiTooltip()" onclick="showScorigamiGames('${key}')">${count}</td>`;
+                parts.push(`<td class="has-score freq-${freq}" data-key="${key}" onmouseenter="showScorigamiTooltip(event,'${key}')" onmouseleave="hideScorigamiTooltip()" onclick="showScorigamiGames('${key}')">${count}</td>`);
             }
         }
-        html += '</tr>';
+        parts.push('</tr>');
     }
-    html += '</tbody>';
-    gridEl.innerHTML = html;
+    parts.push('</tbody>');
+    gridEl.innerHTML = parts.join('');
 }
 
 // Scorigami helpers stored for tooltip
@@ -1323,7 +1523,7 @@ function showScorigamiTooltip(event, key) {
     if (!Object.keys(_scorigamiMap).length) _buildScorigamiMap();
     const games = _scorigamiMap[key] || [];
     if (!games.length) return;
-    const tooltip = document.getElementById('scorigami-tooltip');
+    const tooltip = $('scorigami-tooltip');
     const parts = key.split('-');
     let html = `<strong>${parts[0]}-${parts[1]}</strong> (${games.length} game${games.length > 1 ? 's' : ''})<br>`;
     games.slice(0, 5).forEach(g => {
@@ -1337,7 +1537,7 @@ function showScorigamiTooltip(event, key) {
 }
 
 function hideScorigamiTooltip() {
-    document.getElementById('scorigami-tooltip').classList.remove('visible');
+    $('scorigami-tooltip').classList.remove('visible');
 }
 
 function showScorigamiGames(key) {
@@ -1348,21 +1548,21 @@ function showScorigamiGames(key) {
     const parts = key.split('-');
     let html = `<h3>Score: ${parts[0]}-${parts[1]} (${games.length} games)</h3><div class="day-games-list">`;
     games.forEach(g => {
-        html += `<div class="day-game-item" onclick="closeModal('day-games-modal');showBoxScore('${g.game_id}')">
+        html += `<div class="day-game-item" data-action="close-modal" data-game="${g.game_id}">
             <div class="matchup">${getTeamCode(g.away_team)} @ ${getTeamCode(g.home_team)}</div>
             <div class="score">${g.away_score} - ${g.home_score} | ${g.date}</div>
         </div>`;
     });
     html += '</div>';
-    document.getElementById('day-games-detail').innerHTML = html;
+    $('day-games-detail').innerHTML = html;
     openModal('day-games-modal');
 }
 
 // Calendar
 function renderCalendar() {
     const games = DATA.games || [];
-    const container = document.getElementById('calendar-grid');
-    if (!games.length) { container.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No games found</p>'; return; }
+    const container = $('calendar-grid');
+    if (!games.length) { container.innerHTML = EMPTY.games; return; }
 
     // Group games by month-day (year agnostic): key = "MM-DD"
     const gamesByMonthDay = {};
@@ -1459,14 +1659,14 @@ function showCalendarDay(monthDayKey) {
     dayGames.sort((a, b) => (a.date_yyyymmdd || '').localeCompare(b.date_yyyymmdd || ''));
     dayGames.forEach(g => {
         const year = (g.date_yyyymmdd || '').slice(0, 4);
-        html += `<div class="day-game-item" onclick="closeModal('day-games-modal');showBoxScore('${g.game_id}')">
+        html += `<div class="day-game-item" data-action="close-modal" data-game="${g.game_id}">
             <span class="day-game-year">${year}</span>
             <div class="day-game-matchup">${getTeamCode(g.away_team)} @ ${getTeamCode(g.home_team)}</div>
             <div class="day-game-score">${g.away_score} - ${g.home_score}</div>
         </div>`;
     });
     html += '</div>';
-    document.getElementById('day-games-detail').innerHTML = html;
+    $('day-games-detail').innerHTML = html;
     openModal('day-games-modal');
 }
 
@@ -1478,8 +1678,8 @@ function renderMatchups() {
 
 function renderTeamMatrix() {
     const games = DATA.games || [];
-    const container = document.getElementById('matchup-matrix-container');
-    if (!games.length) { container.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">No games found</p>'; return; }
+    const container = $('matchup-matrix-container');
+    if (!games.length) { container.innerHTML = EMPTY.games; return; }
 
     // Build H2H records
     const h2h = {}; // teamA -> teamB -> { wins, losses }
@@ -1508,33 +1708,33 @@ function renderTeamMatrix() {
 
     const teams = [...teamsSet].sort();
 
-    let html = '<table class="matchup-matrix"><thead><tr><th></th>';
-    teams.forEach(t => { html += `<th>${t}</th>`; });
-    html += '</tr></thead><tbody>';
+    const parts = ['<table class="matchup-matrix"><thead><tr><th></th>'];
+    teams.forEach(t => { parts.push(`<th>${t}</th>`); });
+    parts.push('</tr></thead><tbody>');
 
     teams.forEach(row => {
-        html += `<tr><td class="row-header">${row}</td>`;
+        parts.push(`<tr><td class="row-header">${row}</td>`);
         teams.forEach(col => {
             if (row === col) {
-                html += '<td class="self-cell">-</td>';
+                parts.push('<td class="self-cell">-</td>');
             } else {
                 const record = h2h[row] && h2h[row][col] ? h2h[row][col] : { wins: 0, losses: 0 };
                 const total = record.wins + record.losses;
                 if (total === 0) {
-                    html += '<td>-</td>';
+                    parts.push('<td>-</td>');
                 } else {
                     let cls = '';
                     if (record.wins > record.losses) cls = 'win-record';
                     else if (record.losses > record.wins) cls = 'loss-record';
                     else cls = 'split-record';
-                    html += `<td class="${cls}">${record.wins}-${record.losses}</td>`;
+                    parts.push(`<td class="${cls}">${record.wins}-${record.losses}</td>`);
                 }
             }
         });
-        html += '</tr>';
+        parts.push('</tr>');
     });
-    html += '</tbody></table>';
-    container.innerHTML = html;
+    parts.push('</tbody></table>');
+    container.innerHTML = parts.join('');
 }
 
 function populateH2HDropdowns() {
@@ -1547,18 +1747,18 @@ function populateH2HDropdowns() {
     const teams = [...teamsSet].sort();
 
     ['h2h-team1', 'h2h-team2'].forEach((id, idx) => {
-        const sel = document.getElementById(id);
+        const sel = $(id);
         sel.innerHTML = '<option value="">Select Team</option>' +
             teams.map(t => `<option value="${t}">${t}</option>`).join('');
     });
 }
 
 function renderH2H() {
-    const team1 = document.getElementById('h2h-team1').value;
-    const team2 = document.getElementById('h2h-team2').value;
-    const container = document.getElementById('h2h-results');
+    const team1 = $('h2h-team1').value;
+    const team2 = $('h2h-team2').value;
+    const container = $('h2h-results');
     if (!team1 || !team2 || team1 === team2) {
-        container.innerHTML = '<p style="text-align:center;padding:2rem;color:var(--text-muted);">Select two different teams</p>';
+        container.innerHTML = EMPTY.teamsPicked;
         return;
     }
 
@@ -1568,7 +1768,7 @@ function renderH2H() {
     );
 
     if (!games.length) {
-        container.innerHTML = `<p style="text-align:center;padding:2rem;color:var(--text-muted);">No matchups found between ${getTeamCode(team1)} and ${getTeamCode(team2)}</p>`;
+        container.innerHTML = emptyMessage(`No matchups found between ${getTeamCode(team1)} and ${getTeamCode(team2)}`);
         return;
     }
 
@@ -1595,7 +1795,7 @@ function renderH2H() {
     const sorted = [...games].sort((a,b) => (b.date_yyyymmdd || '').localeCompare(a.date_yyyymmdd || ''));
     sorted.forEach(g => {
         const awayWon = (g.away_score || 0) > (g.home_score || 0);
-        html += `<tr class="game-link" onclick="showBoxScore('${g.game_id}')" style="cursor:pointer;">
+        html += `<tr class="game-link" data-game="${g.game_id}" style="cursor:pointer;">
             <td>${g.date}</td>
             <td style="${awayWon ? 'font-weight:700;color:var(--success);' : ''}">${getTeamCode(g.away_team)}</td>
             <td class="num" style="${awayWon ? 'font-weight:700;color:var(--success);' : ''}">${g.away_score}</td>
@@ -1663,7 +1863,7 @@ function renderSeasonStats() {
     }));
 
     // Chart
-    const ctx = document.getElementById('season-chart');
+    const ctx = $('season-chart');
     if (ctx && stats.length > 1) {
         const isDark = document.documentElement.getAttribute('data-theme') === 'dark';
         const gridColor = isDark ? 'rgba(255,255,255,0.1)' : 'rgba(0,0,0,0.1)';
@@ -1695,7 +1895,7 @@ function renderSeasonStats() {
     }
 
     // Summary
-    const summaryDiv = document.getElementById('season-summary');
+    const summaryDiv = $('season-summary');
     if (summaryDiv && stats.length > 0) {
         const totalGames = stats.reduce((sum, s) => sum + s.games, 0);
         const avgPerSeason = Math.round(totalGames / stats.length);
@@ -1709,7 +1909,7 @@ function renderSeasonStats() {
     }
 
     // Table
-    const tbody = document.querySelector('#season-table tbody');
+    const tbody = $('season-table').tBodies[0];
     if (tbody) {
         tbody.innerHTML = stats.map(s => `<tr>
             <td>${s.season}</td>
@@ -1728,7 +1928,7 @@ function showCalendarSubTab(subId) {
     document.querySelectorAll('#calendar .sub-tab').forEach(t => t.classList.remove('active'));
     document.querySelectorAll('#calendar .sub-section').forEach(s => s.classList.remove('active'));
     document.querySelector(`#calendar .sub-tab[onclick*="${subId}"]`).classList.add('active');
-    document.getElementById(subId).classList.add('active');
+    $(subId).classList.add('active');
     if (subId === 'calendar-onthisday' && !onThisDayInitialized) {
         onThisDayInitialized = true;
         renderOnThisDay();
@@ -1743,7 +1943,7 @@ function renderOnThisDay() {
     const dd = String(today.getDate()).padStart(2, '0');
     const monthNames = ['', 'January', 'February', 'March', 'April', 'May', 'June',
                          'July', 'August', 'September', 'October', 'November', 'December'];
-    document.getElementById('onthisday-date').textContent =
+    $('onthisday-date').textContent =
         `${monthNames[parseInt(mm)]} ${parseInt(dd)}`;
 
     const matchingGames = games.filter(g => {
@@ -1751,8 +1951,8 @@ function renderOnThisDay() {
         return d.length >= 8 && d.slice(4, 6) === mm && d.slice(6, 8) === dd;
     });
 
-    const contentEl = document.getElementById('onthisday-content');
-    const emptyEl = document.getElementById('onthisday-empty');
+    const contentEl = $('onthisday-content');
+    const emptyEl = $('onthisday-empty');
 
     if (!matchingGames.length) {
         contentEl.innerHTML = '';
@@ -1779,7 +1979,7 @@ function renderOnThisDay() {
                 <span style="color:var(--text-muted);font-size:0.85rem;">${agoLabel}</span>
             </div>`;
         byYear[year].forEach(g => {
-            html += `<div class="day-game-item" onclick="showBoxScore('${g.game_id}')">
+            html += `<div class="day-game-item" data-game="${g.game_id}">
                 <div class="day-game-matchup">${getTeamCode(g.away_team)} ${g.away_score} @ ${getTeamCode(g.home_team)} ${g.home_score}</div>
             </div>`;
         });
@@ -1822,18 +2022,16 @@ function performGlobalSearch(query) {
             results.games.push(g);
         }
     });
-    (DATA.players || []).forEach(p => {
+    playerRows.forEach(p => {
         if (results.players.length >= 5) return;
-        if ((p.Player || '').toLowerCase().includes(q) ||
-            (p.Team || '').toLowerCase().includes(q)) {
+        if ((p[PC.Player] || '').toLowerCase().includes(q) ||
+            (p[PC.Team] || '').toLowerCase().includes(q)) {
             results.players.push(p);
         }
     });
     (DATA.venues || []).forEach(v => {
         if (results.arenas.length >= 5) return;
-        if ((v.name || '').toLowerCase().includes(q) ||
-            (v.team || '').toLowerCase().includes(q) ||
-            (v.city || '').toLowerCase().includes(q)) {
+        if (v._k.includes(q)) {
             results.arenas.push(v);
         }
     });
@@ -1841,10 +2039,10 @@ function performGlobalSearch(query) {
 }
 
 function renderGlobalSearchResults(results) {
-    const container = document.getElementById('global-search-results');
+    const container = $('global-search-results');
     const hasResults = results.games.length || results.players.length || results.arenas.length;
     if (!hasResults) {
-        container.innerHTML = '<div class="search-no-results">No results found</div>';
+        container.innerHTML = EMPTY.search;
         container.style.display = 'block';
         return;
     }
@@ -1862,10 +2060,10 @@ function renderGlobalSearchResults(results) {
     if (results.players.length) {
         html += '<div class="search-category"><div class="search-category-label">Players</div>';
         results.players.forEach(p => {
-            const safeName = (p.Player || '').replace(/'/g, "\\'");
+            const safeName = (p[PC.Player] || '').replace(/'/g, "\\'");
             html += `<div class="search-result-item" onclick="selectGlobalSearchResult('player','${safeName}')">
-                <span>${p.Player}</span>
-                <span class="search-result-meta">${getTeamCode(p.Team)} | ${p.Games || 0}G</span>
+                <span>${p[PC.Player]}</span>
+                <span class="search-result-meta">${getTeamCode(p[PC.Team])} | ${p[PC.Games] || 0}G</span>
             </div>`;
         });
         html += '</div>';
@@ -1886,22 +2084,22 @@ function renderGlobalSearchResults(results) {
 
 function selectGlobalSearchResult(type, id) {
     hideGlobalSearchResults();
-    document.getElementById('global-search').value = '';
+    $('global-search').value = '';
     if (type === 'game') showBoxScore(id);
     else if (type === 'player') showPlayerDetail(id);
     else if (type === 'arena') showSection('venues');
 }
 
 function showGlobalSearchResults() {
-    const input = document.getElementById('global-search');
-    const container = document.getElementById('global-search-results');
+    const input = $('global-search');
+    const container = $('global-search-results');
     if (input.value.trim().length >= 2 && container.innerHTML) {
         container.style.display = 'block';
     }
 }
 
 function hideGlobalSearchResults() {
-    document.getElementById('global-search-results').style.display = 'none';
+    $('global-search-results').style.display = 'none';
 }
 
 // Division Progress
@@ -1909,7 +2107,7 @@ function renderDivisionProgress() {
     const checklist = DATA.teamChecklist || {};
     const divisions = checklist.divisions || {};
     const conferences = checklist.conferences || {};
-    const container = document.getElementById('divisions-content');
+    const container = $('divisions-content');
 
     let html = '<div class="conference-summary" style="margin-bottom:1.5rem;">';
     ['East', 'West'].forEach(conf => {
@@ -1968,17 +2166,37 @@ function toggleDivisionDetail(divName) {
 
 // Init
 document.addEventListener('DOMContentLoaded', function() {
+    dataReady.then(data => {
+        DATA = data;
+        DATA.player_games = tableRows(DATA.player_games);
+        // Filter views arrive as positions into DATA.venues
+        DATA.venues_visited = (DATA.venues_visited || []).map(i => DATA.venues[i]);
+        DATA.venues_unvisited = (DATA.venues_unvisited || []).map(i => DATA.venues[i]);
+        playerRows = DATA.players ? DATA.players.rows : [];
+        initPage();
+    }, err => {
+        console.error(err);
+        showToast('Could not load game data');
+    });
+});
+
+function initPage() {
     renderGamesGrid();
     renderLeaders();
     populateTeamDropdown();
-    filteredPlayers = DATA.players ? [...DATA.players] : [];
+    filteredPlayers = [...playerRows];
     renderPlayersTable();
     renderTeamChecklist();
     renderVenuesTable();
+    observeMapSection();
+    populateSelect('milestone-category', MILESTONE_CATS);
+    populateSelect('career-firsts-category', CAREER_FIRST_CATS);
     renderMilestones();
     renderCareerFirsts();
+    $('milestone-search').addEventListener('input', debounce(filterMilestones, SEARCH_DEBOUNCE_MS));
+    $('career-firsts-search').addEventListener('input', debounce(filterCareerFirsts, SEARCH_DEBOUNCE_MS));
     handleURLNavigation();
-});
+}
 
 window.addEventListener('popstate', handleURLNavigation);
 
@@ -1990,7 +2208,18 @@ document.addEventListener('keydown', e => {
 });
 
 document.addEventListener('click', e => {
-    if (!e.target.closest('.global-search-container')) {
+    const t = e.target;
+    if (!t.closest('.global-search-container')) {
         hideGlobalSearchResults();
     }
+    // Modal backdrops carry data-modal-dismiss; close buttons and items that
+    // leave a modal carry data-action="close-modal"
+    if (t.matches('[data-modal-dismiss]') || t.closest('[data-action="close-modal"]')) {
+        closeModal(t.closest('.modal').id);
+    }
+    // Player names anywhere on the page carry data-player
+    const player = t.closest('[data-player]');
+    const game = t.closest('[data-game]');
+    if (player) showPlayerDetail(player.dataset.player);
+    else if (game) showBoxScore(game.dataset.game);
 });
\ No newline at end of file
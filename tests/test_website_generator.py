@@ -0,0 +1,386 @@
+"""
+Tests for the website generator.
+"""
+import base64
+import gzip
+import json
+import re
+import numpy as np
+import pandas as pd
+import pytest
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from nba_processor.processors.player_stats_processor import PlayerStatsProcessor
+from nba_processor.website import generator
+from nba_processor.website.generator import generate_website_from_data
+
+
+@pytest.fixture
+def processed_data(multiple_games_data):
+    """Provide processed player data for website generation."""
+    return PlayerStatsProcessor(multiple_games_data).process_all_player_stats()
+
+
+@pytest.fixture
+def generated_site(tmp_path, processed_data, multiple_games_data):
+    """Generate the website into a temp directory and return the HTML path."""
+    output_path = tmp_path / 'docs' / 'index.html'
+    generate_website_from_data(processed_data, str(output_path), games_data=multiple_games_data)
+    return output_path
+
+
+class TestGenerateWebsite:
+    """Tests for generate_website_from_data."""
+
+    def test_writes_html(self, generated_site):
+        """Test that the HTML page is written."""
+        html = generated_site.read_text(encoding='utf-8')
+        assert html.lower().startswith('<!doctype html>')
+        assert '</html>' in html
+
+    def test_modals_use_delegated_handlers(self, generated_site):
+        """Test that modals are dismissed through data attributes, not inline handlers."""
+        html = generated_site.read_text(encoding='utf-8')
+        assert html.count('data-modal-dismiss') == 3
+        assert len(re.findall(r'data-action="?close-modal', html)) == 3
+        assert 'closeModal(' not in html
+
+    def test_writes_gzip_sibling(self, generated_site):
+        """Test that a gzip copy of the page is written alongside it."""
+        gz_path = Path(str(generated_site) + '.gz')
+        assert gz_path.exists()
+        assert gzip.decompress(gz_path.read_bytes()) == generated_site.read_bytes()
+
+    def test_writes_brotli_sibling(self, generated_site):
+        """Test that a brotli copy of the page is written when brotli is installed."""
+        brotli = pytest.importorskip('brotli')
+        br_path = Path(str(generated_site) + '.br')
+        assert br_path.exists()
+        assert brotli.decompress(br_path.read_bytes()) == generated_site.read_bytes()
+
+    def test_removes_stale_brotli_sibling_without_brotli(self, tmp_path, processed_data,
+                                                          multiple_games_data, monkeypatch):
+        """Test that a build without brotli deletes .br files left by an earlier build."""
+        output_path = tmp_path / 'docs' / 'index.html'
+        output_path.parent.mkdir()
+        stale = [Path(str(output_path) + '.br'), output_path.parent / (generator.DATA_FILENAME + '.br')]
+        for path in stale:
+            path.write_bytes(b'stale')
+        monkeypatch.setattr(generator, 'HAS_BROTLI', False)
+        generate_website_from_data(processed_data, str(output_path), games_data=multiple_games_data)
+        assert not any(path.exists() for path in stale)
+        assert Path(str(output_path) + '.gz').exists()
+
+    def test_links_hashed_assets(self, generated_site):
+        """Test that JS and CSS are written as hashed files and linked from the page."""
+        html = generated_site.read_text(encoding='utf-8')
+        js_files = list(generated_site.parent.glob('app.*.js'))
+        css_files = list(generated_site.parent.glob('styles.*.css'))
+        assert len(js_files) == 1 and len(css_files) == 1
+        assert re.search(rf'<script[^>]* src="?{re.escape(js_files[0].name)}', html)
+        assert re.search(rf'<link[^>]* href="?{re.escape(css_files[0].name)}', html)
+        assert js_files[0].read_bytes() == generator._JS
+
+    def test_script_starts_with_generated_team_constants(self):
+        """Test that the served script defines the team lookups from NBA_TEAMS."""
+        assert generator._JS.startswith(b'const TEAM_SHORT_NAMES=')
+        assert b'"Los Angeles Lakers":"LAL"' in generator._JS
+        assert generator._JS.count(b'const TEAM_CODES=') == 1
+
+    def test_hashed_asset_replaces_stale_copy(self, tmp_path):
+        """Test that writing a new asset version removes the previous one."""
+        old_name = generator._write_hashed_asset(str(tmp_path), 'app', 'js', b'var a = 1;')
+        new_name = generator._write_hashed_asset(str(tmp_path), 'app', 'js', b'var a = 2;')
+        assert old_name != new_name
+        assert not (tmp_path / old_name).exists()
+        assert not (tmp_path / (old_name + '.gz')).exists()
+        assert (tmp_path / new_name).read_text() == 'var a = 2;'
+
+    def test_writes_data_file(self, generated_site):
+        """Test that the payload is written as strict JSON and preloaded by the page."""
+        data_path = generated_site.parent / generator.DATA_FILENAME
+        data = json.loads(data_path.read_text(encoding='utf-8'), parse_constant=pytest.fail)
+        assert data['summary']['totalGames'] > 0
+        html = generated_site.read_text(encoding='utf-8')
+        assert 'const DATA' not in html
+        tag = re.search(r'<link[^>]*nba_data\.json\?v=[0-9a-f]{10}[^>]*>', html)
+        assert tag and 'rel=preload' in tag.group(0).replace('"', '')
+        assert Path(str(data_path) + '.gz').exists()
+
+    def test_venue_filter_views_partition_venues(self, generated_site):
+        """Test that the visited/unvisited index lists split the venues between them."""
+        data = json.loads((generated_site.parent / generator.DATA_FILENAME).read_bytes())
+        visited, unvisited = data['venues_visited'], data['venues_unvisited']
+        assert sorted(visited + unvisited) == list(range(len(data['venues'])))
+        assert all(data['venues'][i]['visited'] for i in visited)
+        assert not any(data['venues'][i]['visited'] for i in unvisited)
+
+    def test_venue_coordinates_are_float32_columns(self, generated_site):
+        """Test that marker coordinates ship as base64 float32 columns, one entry per venue."""
+        data = json.loads((generated_site.parent / generator.DATA_FILENAME).read_bytes())
+        lat = np.frombuffer(base64.b64decode(data['venue_lat']), dtype='<f4')
+        lng = np.frombuffer(base64.b64decode(data['venue_lng']), dtype='<f4')
+        assert len(lat) == len(lng) == len(data['venues'])
+        assert 'lat' not in data['venues'][0]
+        arenas = generator._ARENAS_DF.set_index('team')
+        first = data['venues'][0]['team']
+        assert lat[0] == pytest.approx(arenas.loc[first, 'lat'], abs=1e-4)
+
+    def test_cached_json_matches_fresh_payload(self, tmp_path, processed_data, generated_site):
+        """Test that pre-encoded frames produce the same payload as converting them."""
+        cached = {key: generator.encode_frame(key, processed_data[key]) for key in ('players', 'player_games')}
+        output_path = tmp_path / 'cached' / 'index.html'
+        generate_website_from_data(processed_data, str(output_path), cached_json=cached)
+        fresh = json.loads((generated_site.parent / generator.DATA_FILENAME).read_bytes())
+        spliced = json.loads((output_path.parent / generator.DATA_FILENAME).read_bytes())
+        # The fixture passes games_data; only the games summary depends on it
+        fresh.pop('games')
+        spliced.pop('games')
+        assert spliced == fresh
+        assert list(spliced)[:2] == list(processed_data)[:2]
+
+    def test_parallel_encoding_matches_sequential(self, monkeypatch, processed_data):
+        """Test that encoding frames on the thread pool gives the same bytes."""
+        frames = {k: v for k, v in processed_data.items() if isinstance(v, pd.DataFrame)}
+        sequential = generator._encode_frames(frames)
+        monkeypatch.setattr(generator, '_PARALLEL_ENCODE_ROWS', 0)
+        parallel = generator._encode_frames(frames)
+        assert list(parallel.items()) == list(sequential.items())
+
+    def test_precompressed_output_is_reproducible(self, tmp_path):
+        """Test that gzip output does not embed a timestamp."""
+        path = tmp_path / 'page.html'
+        path.write_text('<html>' + 'x' * 1000 + '</html>')
+        generator._write_precompressed(str(path))
+        first = Path(str(path) + '.gz').read_bytes()
+        generator._write_precompressed(str(path))
+        assert Path(str(path) + '.gz').read_bytes() == first
+
+
+class TestGenerateHtml:
+    """Tests for filling the precompiled page template."""
+
+    def test_fills_every_field(self):
+        """Test that every placeholder is substituted and unsafe attribute values are quoted."""
+        html = generator._generate_html(
+            {'teamsSeen': 7, 'totalGames': 12}, 'styles.css', 'app.js', 'nba_data.json?v=abc',
+        ).decode('utf-8')
+        assert not re.search(r'\{(%s)\}' % '|'.join(generator._HTML_FIELDS), html)
+        assert re.search(r'href=["\']nba_data\.json\?v=abc["\']', html)
+        assert '--progress:23.3333' in html.replace(' ', '')
+
+
+class TestDumpsJson:
+    """Tests for payload serialization."""
+
+    def test_datetimes_match_str(self):
+        """Test that datetimes serialize the way str() formats them."""
+        stamp = datetime(2024, 1, 2, 3, 4)
+        payload = json.loads(generator._dumps_json({'when': stamp, 'day': stamp.date()}))
+        assert payload == {'when': '2024-01-02 03:04:00', 'day': '2024-01-02'}
+
+    def test_returns_compact_bytes(self):
+        """Test that the payload is UTF-8 bytes without padding whitespace."""
+        out = generator._dumps_json({'player': 'Nikola Jokić', 'pts': [30, 12]})
+        assert isinstance(out, bytes)
+        assert out.decode('utf-8') == '{"player":"Nikola Jokić","pts":[30,12]}'
+
+    def test_fallback_emits_strict_json(self, monkeypatch):
+        """Test that the stdlib fallback turns NaN into null."""
+        monkeypatch.setattr(generator, 'HAS_ORJSON', False)
+        out = generator._dumps_json({'fg_pct': [float('nan'), 0.5]})
+        assert out == b'{"fg_pct":[null,0.5]}'
+
+    def test_numeric_columns_encode_alike(self, monkeypatch):
+        """Test that numpy-backed table columns encode the same with either encoder."""
+        df = pd.DataFrame({'pts': [10, 20], 'fg_pct': [0.5, float('nan')], 'starter': [True, False]})
+        table = generator._df_to_table(df)
+        fast = generator._dumps_json(table)
+        monkeypatch.setattr(generator, 'HAS_ORJSON', False)
+        assert generator._dumps_json(table) == fast == (
+            b'{"columns":["pts","fg_pct","starter"],"data":[{"dtype":"i1","b64":"ChQ="},[0.5,null],[true,false]]}'
+        )
+
+
+class TestFrameSerialization:
+    """Tests for DataFrame-to-payload conversion."""
+
+    def test_records_match_pandas(self):
+        """Test that row records match to_dict, with missing values as None."""
+        df = pd.DataFrame({'player': ['A', 'B'], 'pts': [10, 20], 'fg_pct': [0.5, float('nan')]})
+        records = generator._df_to_records(df)
+        assert records[0] == {'player': 'A', 'pts': 10, 'fg_pct': 0.5}
+        assert records[1]['fg_pct'] is None or records[1]['fg_pct'] != records[1]['fg_pct']
+
+    def test_records_fall_back_on_mixed_columns(self):
+        """Test that columns Arrow cannot type still convert."""
+        df = pd.DataFrame({'value': [1, 'two']})
+        assert generator._df_to_records(df) == [{'value': 1}, {'value': 'two'}]
+
+    def test_table_layout_with_categories(self):
+        """Test the column-wise layout with categorical columns as codes."""
+        df = pd.DataFrame({'team': ['BOS', 'LAL', None, 'BOS'], 'pts': [10, 20, 30, 40]})
+        table = generator._df_to_table(df, ('team',))
+        assert json.loads(generator._dumps_json(table)) == {
+            'columns': ['team', 'pts'],
+            'data': [{'categories': ['BOS', 'LAL'], 'codes': [0, 1, -1, 0]}, {'dtype': 'i1', 'b64': 'ChQeKA=='}],
+        }
+
+    def test_int_columns_pack_to_narrowest_type(self):
+        """Test that integer columns pack into the smallest signed type that holds them."""
+        for values, tag in [([-128, 127], 'i1'), ([0, 300], 'i2'), ([-40000, 5], 'i4')]:
+            packed = generator._pack_int_column(np.array(values))
+            assert packed['dtype'] == tag
+            assert np.frombuffer(base64.b64decode(packed['b64']), dtype='<' + tag).tolist() == values
+        assert generator._pack_int_column(np.array([2 ** 40])) is None
+        assert generator._pack_int_column(np.array([], dtype=np.int64)) == {'dtype': 'i1', 'b64': ''}
+
+    def test_player_games_newest_first_with_stable_ties(self):
+        """Test that player_games rows sort by date descending, keeping tie order."""
+        df = pd.DataFrame({'date': ['2024-01-01', '2024-02-01', '2024-01-01', '2024-02-01'],
+                           'player': ['A', 'B', 'C', 'D']})
+        table = json.loads(generator.encode_frame('player_games', df))
+        assert table['data'][1] == ['B', 'D', 'A', 'C']
+
+    def test_rows_layout(self):
+        """Test the fixed-column row layout used for the players table."""
+        df = pd.DataFrame({'PPG': [10.5, 20.0], 'Player': ['A', 'B'], 'Player ID': [1, 2]})
+        rows = generator._df_to_rows(df, ['Player', 'PPG', 'RPG'])
+        assert json.loads(generator._dumps_json(rows)) == {
+            'columns': ['Player', 'PPG', 'RPG'],
+            'rows': [['A', 10.5, None], ['B', 20.0, None]],
+        }
+
+    def test_player_rows_carry_csv_line(self):
+        """Test that each players row ends with its CSV line, quoted only where needed."""
+        df = pd.DataFrame({'Player': ['Smith, Jr.'], 'Team': ['BOS'], 'Games': [4], 'PPG': [10.0]})
+        row = generator._player_rows(df)['rows'][0]
+        assert len(row) == len(generator.PLAYER_COLUMNS) + 1
+        assert row[-1] == '"Smith, Jr.",BOS,4,,10' + ',' * (len(generator.PLAYER_COLUMNS) - 5)
+
+    def test_player_columns_match_page(self):
+        """Test that the players payload uses the page's playerCols order."""
+        app_js = (generator.STATIC_DIR / 'app.js').read_text()
+        match = re.search(r'const playerCols = \[(.*?)\];', app_js, re.S)
+        assert re.findall(r"'([^']*)'", match.group(1)) == generator.PLAYER_COLUMNS
+
+
+class TestGamesSummary:
+    """Tests for the one-row-per-game summary."""
+
+    def test_infers_home_team_from_game_id(self):
+        """Test that player rows alone give home/away teams and scores, newest first."""
+        df = pd.DataFrame({
+            'game_id': ['202401150BOS', '202401150BOS', '202401100LAL'],
+            'date': ['January 15, 2024', 'January 15, 2024', 'January 10, 2024'],
+            'date_yyyymmdd': ['20240115', '20240115', '20240110'],
+            'team': ['Los Angeles Lakers', 'Boston Celtics', 'Los Angeles Lakers'],
+            'score': ['105-120', '120-105', '99-98'],
+        })
+        table, games = generator._process_player_games(df)
+        assert [g['game_id'] for g in games] == ['202401150BOS', '202401100LAL']
+        first = games[0]
+        assert (first['home_team'], first['away_team']) == ('Boston Celtics', 'Los Angeles Lakers')
+        assert (first['home_score'], first['away_score']) == (120, 105)
+        assert first['players'] == 2
+        assert first['game_type'] == 'regular'
+        game_ids = table['data'][table['columns'].index('game_id')]
+        assert game_ids == {'categories': ['202401150BOS', '202401100LAL'], 'codes': [0, 0, 1]}
+
+
+class TestWitnessedCareerFirsts:
+    """Tests for matching career firsts/milestones to attended games."""
+
+    def test_sorted_newest_first_then_by_milestone(self):
+        """Test ordering by date, then milestone number, across firsts and milestones."""
+        games_df = pd.DataFrame({'game_id': ['g1', 'g2']})
+        cache = {
+            '_processed_games': [],
+            'p1': {
+                'player_name': 'Player One',
+                'firsts': {'pts': {'game_id': 'g1', 'date': '2023-01-01', 'milestone': 'First points'}},
+                'milestones': {'pts': [
+                    {'game_id': 'g2', 'date': '2024-01-01', 'number': 1000, 'milestone': '1,000th point'},
+                    {'game_id': 'g2', 'date': '2024-01-01', 'number': 2000, 'milestone': '2,000th point'},
+                    {'game_id': 'g9', 'date': '2025-01-01', 'number': 3000, 'milestone': '3,000th point'},
+                ]},
+            },
+        }
+        witnessed = generator._find_witnessed_career_firsts(games_df, cache)
+        assert [w['milestone'] for w in witnessed] == ['2,000th point', '1,000th point', 'First points']
+        assert witnessed[-1]['milestone_number'] == 0
+
+
+class TestVenueStats:
+    """Tests for arena visit statistics."""
+
+    def test_counts_visits_and_date_range(self):
+        """Test per-arena visit counts, first/last visit and the pre-2024 Clippers rule."""
+        df = pd.DataFrame({
+            'game_id': ['202301100LAC', '202401150LAC', '202401150LAC', '202402010BOS', 'bad'],
+            'date': ['January 10, 2023', 'January 15, 2024', 'January 15, 2024', 'February 1, 2024', 'x'],
+        })
+        stats = generator._calculate_venue_stats(df)
+        venues = {v['code']: v for v in stats['venues']}
+        assert venues['LAL']['games'] == 1
+        assert venues['LAL']['first_visit'] == 'January 10, 2023'
+        assert venues['LAC']['games'] == 1
+        assert venues['BOS']['visited'] is True
+        assert venues['NYK'] == {**venues['NYK'], 'visited': False, 'games': 0, 'first_visit': None}
+        assert stats['arenas_visited'] == 3
+
+    def test_popup_markup(self):
+        """Test the prebuilt map popup for visited and unvisited arenas."""
+        venue = {'team': 'Celtics', 'name': 'TD Garden', 'city': 'Boston', 'state': 'MA',
+                 'visited': True, 'games': 3}
+        assert generator._venue_popup(venue) == (
+            '<strong>Celtics</strong><br>TD Garden<br>Boston, MA<br><em>3 games</em>')
+        assert generator._venue_popup({**venue, 'visited': False, 'games': 0}).endswith(
+            '<em>Not visited</em>')
+
+
+class TestMilestoneIndex:
+    """Tests for milestone search keys and category buckets."""
+
+    def test_index_sorts_newest_first_and_adds_search_key(self):
+        """Test that milestone rows are date-sorted and get a lowercase search key."""
+        milestones = {'triple_doubles': [
+            {'player': 'LeBron James', 'team': 'Lakers', 'date_yyyymmdd': '20240101'},
+            {'player': 'Nikola Jokic', 'team': 'Nuggets', 'date_yyyymmdd': '20240301'},
+        ]}
+        indexed = generator._index_milestones(milestones)
+        rows = indexed['triple_doubles']
+        assert [r['player'] for r in rows] == ['Nikola Jokic', 'LeBron James']
+        assert rows[0]['_k'] == 'nikola jokic\nnuggets'
+        assert '_k' not in milestones['triple_doubles'][0]
+
+    def test_buckets_follow_display_order(self):
+        """Test that buckets list only non-empty keys, in the master order."""
+        milestones = {
+            'ten_rebound_games': [{'player': 'A'}],
+            'triple_doubles': [{'player': 'B'}],
+            'double_doubles': [],
+            'custom_games': [{'player': 'C'}],
+        }
+        buckets = generator._bucket_milestones(milestones)
+        assert buckets['all'] == ['triple_doubles', 'ten_rebound_games', 'custom_games']
+        assert buckets['multi'] == ['triple_doubles']
+        assert buckets['scoring'] == []
+
+    def test_prerendered_cards(self):
+        """Test the prerendered default view: titles, escaping and the row cap."""
+        rows = [{'player': "D'Angelo Russell", 'team': 'Lakers', 'opponent': 'Suns',
+                 'date': 'January 1, 2024', 'detail': '20 PTS & 10 AST'}] * 52
+        html = generator._milestones_html(
+            {'double_doubles': rows, 'custom_games': rows[:1]},
+            ['double_doubles', 'custom_games'], {'double_doubles': 'Double-Doubles'})
+        assert '<h4>Double-Doubles <span class="count">52</span></h4>' in html
+        assert '<h4>Custom Games <span class="count">1</span></h4>' in html
+        assert html.count('<tr><td>') == generator.MILESTONE_ROWS_SHOWN + 1
+        assert '...and 2 more' in html
+        assert 'data-player="D&#x27;Angelo Russell"' in html
+        assert '20 PTS &amp; 10 AST' in html